@@ -60,6 +60,25 @@ class Camera:
         frame = cv2.flip(frame, 1)
         return True, frame
 
+    def grab(self) -> bool:
+        """Grab the next frame without decoding it (used to skip frames).
+
+        Returns:
+            True if a frame was grabbed.
+        """
+        if not self._is_running or self.cap is None:
+            return False
+        return self.cap.grab()
+
+    @property
+    def fps(self) -> float:
+        """Frame rate reported by the camera (30 if unknown)."""
+        if self.cap is not None:
+            fps = self.cap.get(cv2.CAP_PROP_FPS)
+            if fps and fps > 0:
+                return fps
+        return 30.0
+
     def get_frame_rgb(self) -> Tuple[bool, Optional[np.ndarray]]:
         """Read a frame and convert to RGB format.
 
@@ -6,7 +6,6 @@ from dataclasses import dataclass
 
 import mediapipe as mp
 from mediapipe import solutions
-from mediapipe.framework.formats import landmark_pb2
 
 
 @dataclass
@@ -43,18 +42,25 @@ class HandLandmarks:
 class HandTracker:
     """Tracks hands using MediaPipe Hands solution."""
 
+    # Drawing colors (BGR)
+    CONNECTION_COLOR = (224, 224, 224)  # White-gray
+    LANDMARK_COLOR = (0, 0, 255)  # Red
+
     def __init__(self,
                  max_num_hands: int = 2,
                  min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 model_complexity: int = 0):
 
         self.mp_hands = solutions.hands
-        self.mp_drawing = solutions.drawing_utils
-        self.mp_drawing_styles = solutions.drawing_styles
+
+        # Hand connections as an index array for vectorized drawing
+        self._connections = np.array(sorted(self.mp_hands.HAND_CONNECTIONS), dtype=np.intp)
 
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
@@ -63,7 +69,8 @@ class HandTracker:
         """Process a frame and return detected hands.
 
         Args:
-            frame_rgb: RGB image as numpy array.
+            frame_rgb: RGB image as numpy array. Marking it read-only
+                (``flags.writeable = False``) lets MediaPipe skip a copy.
 
         Returns:
             List of HandLandmarks for each detected hand.
@@ -93,6 +100,9 @@ class HandTracker:
     def draw_landmarks(self, frame_bgr: np.ndarray, hands: List[HandLandmarks]) -> np.ndarray:
         """Draw hand landmarks on frame.
 
+        All connections of a hand are drawn with a single cv2.polylines call
+        instead of MediaPipe's per-line Python drawing loop.
+
         Args:
             frame_bgr: BGR image to draw on.
             hands: List of HandLandmarks to draw.
@@ -100,24 +110,23 @@ class HandTracker:
         Returns:
             Frame with landmarks drawn.
         """
+        if not hands:
+            return frame_bgr
+
         frame = frame_bgr.copy()
+        h, w = frame.shape[:2]
+        scale = np.array([w, h], dtype=np.float32)
 
         for hand in hands:
-            # Create a landmark list for drawing
-            landmark_list = landmark_pb2.NormalizedLandmarkList()
-            for x, y, z in hand.landmarks:
-                landmark = landmark_list.landmark.add()
-                landmark.x = x
-                landmark.y = y
-                landmark.z = z
-
-            self.mp_drawing.draw_landmarks(
-                frame,
-                landmark_list,
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                self.mp_drawing_styles.get_default_hand_connections_style()
-            )
+            # Normalized (x, y) -> pixel coordinates
+            pts = (np.asarray(hand.landmarks, dtype=np.float32)[:, :2] * scale).astype(np.int32)
+
+            # One (N, 2, 2) array of line segments -> one polylines call
+            cv2.polylines(frame, pts[self._connections], False,
+                          self.CONNECTION_COLOR, 2, cv2.LINE_AA)
+
+            for x, y in pts:
+                cv2.circle(frame, (int(x), int(y)), 4, self.LANDMARK_COLOR, -1, cv2.LINE_AA)
 
         return frame
 
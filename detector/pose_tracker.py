@@ -59,14 +59,15 @@ class PoseTracker:
 
     def __init__(self,
                  min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 model_complexity: int = 0):
 
         self.mp_pose = solutions.pose
         self.mp_drawing = solutions.drawing_utils
 
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=1,
+            model_complexity=model_complexity,
             smooth_landmarks=True,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
@@ -76,7 +77,8 @@ class PoseTracker:
         """Process a frame and return head region data.
 
         Args:
-            frame_rgb: RGB image as numpy array.
+            frame_rgb: RGB image as numpy array. Marking it read-only
+                (``flags.writeable = False``) lets MediaPipe skip a copy.
 
         Returns:
             HeadRegion with head position data, or None if not detected.
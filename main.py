@@ -9,6 +9,8 @@ import os
 import argparse
 import time
 import threading
+from datetime import datetime
+from tkinter import TclError
 
 # Enable DPI awareness on Windows for correct screen positioning
 if sys.platform == 'win32':
@@ -92,10 +94,11 @@ class Application:
         self.main_window = MainWindow(self.config)
 
         # Set up system tray
+        # pystray calls these from its own thread; run them on the Tk thread
         self.system_tray = SystemTray(
-            on_show=self._show_window,
-            on_quit=self._quit_app,
-            on_toggle=self._toggle_monitoring
+            on_show=self._on_tk_thread(self._show_window),
+            on_quit=self._on_tk_thread(self._quit_app),
+            on_toggle=self._on_tk_thread(self._toggle_monitoring)
         )
         self.system_tray.start()
 
@@ -132,6 +135,10 @@ class Application:
         # Run main loop
         self.main_window.mainloop()
 
+        # Write settings whose debounced save is still pending
+        self.config.flush()
+        self.stats_manager.close()
+
     def _initialize_app(self) -> None:
         """Initialize app components in background thread."""
         # Step 1: Config (already done in __init__)
@@ -211,6 +218,16 @@ class Application:
             # Small sleep to prevent CPU spinning
             time.sleep(0.016)  # ~60fps
 
+    def _on_tk_thread(self, callback):
+        """Wrap a callback so calling it from any thread runs it on the Tk thread."""
+        def post() -> None:
+            if self.main_window:
+                try:
+                    self.main_window.after(0, callback)
+                except (RuntimeError, TclError):
+                    pass  # Main loop is gone
+        return post
+
     def _show_window(self) -> None:
         """Show main window from tray."""
         if self.main_window:
@@ -307,6 +324,19 @@ class Application:
         """Log a touch event to statistics."""
         self.stats_manager.log_event(duration, closest_distance)
 
+        # Drop the open statistics window's cached data (on the UI thread)
+        if self.statistics_window is not None and self.main_window:
+            today = datetime.now().strftime("%Y-%m-%d")
+            self.main_window.after(0, lambda: self._invalidate_statistics(today))
+
+    def _invalidate_statistics(self, date_str: str) -> None:
+        """Invalidate cached statistics in the open statistics window."""
+        if self.statistics_window is not None:
+            try:
+                self.statistics_window.invalidate(date_str)
+            except Exception:
+                pass  # Window is being closed
+
     def _on_language_change(self) -> None:
         """Handle language change - update all UI components."""
         if self.main_window:
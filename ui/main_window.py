@@ -1,19 +1,75 @@
 """Main window UI using CustomTkinter."""
 import customtkinter as ctk
+import PIL
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 import cv2
 import numpy as np
+import os
 import threading
 import time
+import types
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable
-from tkinter import font as tkfont
+import queue
+from collections import OrderedDict
+from typing import Optional, Callable, List, Tuple
+from tkinter import font as tkfont, TclError
 
 from detector import Camera, HandTracker, PoseTracker, ProximityAnalyzer
 
 # Path to the app icon
 APP_ICON_PATH = Path(__file__).parent.parent / "assets" / "icon.ico"
-from detector.analyzer import AlertState
+from detector.analyzer import AlertState, AnalysisResult
+
+# Preview resize backend: Pillow-SIMD (version tagged ".postN") has a fast
+# SIMD BILINEAR resampler, otherwise OpenCV is used
+RESIZE_BACKEND = "pil" if "post" in PIL.__version__ else "cv2"
+
+# Logo size shown in the top bar (matches the CTkImage size)
+LOGO_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def _load_logo_cached(path_str: str, mtime: float) -> Image.Image:
+    """Decode and resize the logo icon once per file version.
+
+    The mtime argument is only part of the cache key so a replaced icon
+    file is picked up again.
+    """
+    icon = Image.open(path_str)
+    if icon.mode != 'RGBA':
+        icon = icon.convert('RGBA')
+    if icon.size != (LOGO_SIZE, LOGO_SIZE):
+        icon = icon.resize((LOGO_SIZE, LOGO_SIZE), Image.Resampling.LANCZOS)
+    return icon
+
+
+@lru_cache(maxsize=256)
+def measure_text_width(family: Optional[str], size: int, weight: str, text: str) -> int:
+    """Measure text width in pixels, memoized per font and text."""
+    if family is None:
+        tk_font = tkfont.Font(size=size)
+    else:
+        tk_font = tkfont.Font(family=family, size=size, weight=weight)
+    return tk_font.measure(text)
+
+
+def configure_opencv(num_threads: int = 0) -> None:
+    """Configure OpenCV threading so it doesn't oversubscribe MediaPipe.
+
+    Args:
+        num_threads: OpenCV worker threads (0 = half the CPU cores).
+    """
+    cv2.setUseOptimized(True)
+    if not cv2.useOptimized():
+        print("OpenCV optimized code paths are not available")
+
+    if num_threads <= 0:
+        num_threads = max(1, (os.cpu_count() or 2) // 2)
+    cv2.setNumThreads(num_threads)
+
+    # The small per-frame operations here don't benefit from OpenCL transfers
+    cv2.ocl.setUseOpenCL(False)
 
 
 def center_window_on_screen(window, width: int, height: int) -> str:
@@ -37,16 +93,101 @@ from utils import Config, AlertManager
 from utils.i18n import t, get_language
 from ui.fullscreen_alert import FullscreenAlert
 
+# Translation keys used by the main window, resolved once per language change
+UI_STRING_KEYS = (
+    'alert_subtitle',
+    'alert_title',
+    'app_subtitle',
+    'app_title',
+    'btn_about',
+    'btn_minimize',
+    'btn_settings',
+    'btn_start',
+    'btn_statistics',
+    'btn_stop',
+    'camera_error',
+    'camera_error_help',
+    'camera_instruction',
+    'camera_preview',
+    'detection_progress',
+    'distance_label',
+    'fullscreen_alert_dismiss',
+    'fullscreen_alert_move_hand',
+    'preview_label',
+    'preview_off_hint',
+    'preview_off_message',
+    'preview_off_status',
+    'preview_tooltip',
+    'status_cooldown',
+    'status_cooldown_desc',
+    'status_detecting',
+    'status_detecting_desc',
+    'status_monitoring',
+    'status_monitoring_desc',
+    'status_normal',
+    'status_normal_desc',
+    'status_standby',
+    'status_standby_desc',
+    'status_warning',
+    'status_warning_desc',
+)
+
+
+# Status bar style per analyzer state: (color, status text key, description key)
+STATE_STATUS_STYLES = {
+    AlertState.IDLE: ("#28a745", 'status_normal', 'status_normal_desc'),
+    AlertState.DETECTING: ("#ffc107", 'status_detecting', 'status_detecting_desc'),
+    AlertState.ALERT: ("#dc3545", 'status_warning', 'status_warning_desc'),
+    AlertState.COOLDOWN: ("#6c757d", 'status_cooldown', 'status_cooldown_desc'),
+}
+
+# Preview overlay status text color per analyzer state (RGB for PIL)
+STATE_OVERLAY_COLORS = {
+    AlertState.IDLE: (0, 255, 0),  # Green
+    AlertState.DETECTING: (255, 255, 0),  # Yellow
+    AlertState.ALERT: (255, 0, 0),  # Red
+    AlertState.COOLDOWN: (128, 128, 128),  # Gray
+}
+
+
+def build_ui_strings() -> types.SimpleNamespace:
+    """Translate all main window strings for the current language at once."""
+    return types.SimpleNamespace(**{key: t(key) for key in UI_STRING_KEYS})
+
 
 class MainWindow(ctk.CTk):
     """Main application window."""
 
+    # UI updates are driven by <<NewFrame>> events; the watchdog only keeps
+    # the status current if no event arrives for a while (milliseconds)
+    UI_WATCHDOG_MS = 500
+
+    # Alert overlay colors
+    OVERLAY_COLOR = "#dc3545"
+    OVERLAY_FLASH_COLOR = "#ff0000"
+    OVERLAY_FLASH_SEQUENCE = (OVERLAY_FLASH_COLOR, OVERLAY_COLOR,
+                              OVERLAY_FLASH_COLOR, OVERLAY_COLOR)
+
+    # Status text box drawn on the preview (x1, y1, x2, y2, inclusive)
+    STATUS_BOX = (10, 10, 280, 75)
+    STATUS_CACHE_SIZE = 64  # Rendered status boxes kept
+
+    # Motion gate: MediaPipe is skipped while a 64x36 grayscale thumbnail
+    # differs from the last processed one by less than MOTION_THRESHOLD
+    # (mean absolute difference, 0-255), but never for more than
+    # MOTION_MAX_SKIP frames in a row so a missed detection can't stick
+    MOTION_THUMB_SIZE = (64, 36)
+    MOTION_THRESHOLD = 2.0
+    MOTION_MAX_SKIP = 15
+
     def __init__(self, config: Config):
         super().__init__()
 
         self.config = config
         self.settings = config.settings
 
+        configure_opencv(self.settings.opencv_threads)
+
         # Window setup
         self.title("Don't Touch")
         self.minsize(1050, 650)  # Increased to fit all buttons
@@ -70,8 +211,9 @@ class MainWindow(ctk.CTk):
 
         # Initialize components
         self.camera = Camera()
-        self.hand_tracker = HandTracker()
-        self.pose_tracker = PoseTracker()
+        self._model_complexity = self.settings.model_complexity
+        self.hand_tracker = HandTracker(model_complexity=self._model_complexity)
+        self.pose_tracker = PoseTracker(model_complexity=self._model_complexity)
         self.analyzer = ProximityAnalyzer(
             distance_threshold=self.settings.sensitivity,
             trigger_time=self.settings.trigger_time,
@@ -88,10 +230,33 @@ class MainWindow(ctk.CTk):
 
         # State
         self._is_running = False
-        self._frame_count = 0
+        self._stop_event = threading.Event()  # Set to stop the current capture loop
         self._update_thread: Optional[threading.Thread] = None
+        # Latest display frame. The capture thread publishes a new array each
+        # time with a single reference store (atomic under the GIL) and never
+        # mutates it afterwards, so readers need no lock
         self._current_frame: Optional[np.ndarray] = None
-        self._frame_lock = threading.Lock()
+        self._frame_lock = threading.Lock()  # Guards the _ready_image hand-off
+        # Analysis results are published through a queue by the capture thread
+        # and drained on the UI thread, which keeps the latest one in
+        # _ui_result so state reads only touch UI-thread memory
+        self._result_queue: "queue.SimpleQueue[AnalysisResult]" = queue.SimpleQueue()
+        self._ui_result: Optional[AnalysisResult] = None
+        self._last_result: Optional[AnalysisResult] = None  # Last result shown by _update_ui
+
+        # Preview worker: resizes frames off the UI thread into two alternating
+        # buffers owned by the worker's session; the UI thread only turns the ready image into a PhotoImage
+        self._preview_thread: Optional[threading.Thread] = None
+        self._preview_stop: Optional[threading.Event] = None  # Set to end the current worker
+        self._preview_size: Optional[Tuple[int, int]] = None  # Set on video frame <Configure>
+        self._preview_target: Optional[Tuple[int, int, int, int, int, int]] = None
+        self._ready_image: Optional[Image.Image] = None
+        self._preview_frame_event = threading.Event()  # New frame captured
+        self._preview_consumed = threading.Event()  # UI thread took the last image
+        self._preview_consumed.set()
+        self._ui_pending = threading.Event()  # <<NewFrame>> queued, not yet handled
+        self._ui_watchdog_id: Optional[str] = None
+        self._photo: Optional[ImageTk.PhotoImage] = None  # Reused preview photo
 
         # Callbacks
         self._on_minimize_to_tray: Optional[Callable] = None
@@ -100,23 +265,41 @@ class MainWindow(ctk.CTk):
         self._on_about_click: Optional[Callable] = None
         self._on_close_request: Optional[Callable] = None
 
+        # Overlay fonts are loaded once, in the background during startup
+        self._warmup_done = threading.Event()
+        threading.Thread(target=self._warmup, daemon=True).start()
+        # Rendered status boxes, LRU-ordered (capture thread only)
+        self._overlay_cache: "OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._last_dist_bucket: Optional[int] = None
+        self._last_dist_text = ""
+
+        # Translated strings (rebuilt by update_language)
+        self._s = build_ui_strings()
+        self._state_ui = self._build_state_ui()
+
         # Build UI
         self._create_ui()
 
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Handle window resize
-        self.bind("<Configure>", self._on_resize)
-        self._last_resize_time = 0
+        # Worker threads post <<NewFrame>> when a frame or result is ready
+        self.bind("<<NewFrame>>", self._update_ui_event)
 
-    def _on_resize(self, event) -> None:
-        """Handle window resize event."""
-        # Throttle resize events
-        current_time = time.time()
-        if current_time - self._last_resize_time < 0.1:
-            return
-        self._last_resize_time = current_time
+        # Track whether the window is on screen (minimized/tray hides the preview)
+        self._preview_visible = True
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
+
+    def _on_map(self, event) -> None:
+        """Resume preview rendering when the window is shown."""
+        if event.widget is self:
+            self._preview_visible = True
+
+    def _on_unmap(self, event) -> None:
+        """Pause preview rendering while the window is minimized or hidden."""
+        if event.widget is self:
+            self._preview_visible = False
 
     def _create_ui(self) -> None:
         """Create the user interface."""
@@ -160,7 +343,8 @@ class MainWindow(ctk.CTk):
 
         # App logo icon
         logo_pil = self._load_logo_pil_image()
-        self.logo_image = ctk.CTkImage(light_image=logo_pil, dark_image=logo_pil, size=(32, 32))
+        self.logo_image = ctk.CTkImage(light_image=logo_pil, dark_image=logo_pil,
+                                       size=(LOGO_SIZE, LOGO_SIZE))
         self.logo_label = ctk.CTkLabel(
             title_frame,
             image=self.logo_image,
@@ -171,7 +355,7 @@ class MainWindow(ctk.CTk):
         # Title text
         self.title_label = ctk.CTkLabel(
             title_frame,
-            text=t('app_title'),
+            text=self._s.app_title,
             font=ctk.CTkFont(size=22, weight="bold")
         )
         self.title_label.pack(side="left")
@@ -179,7 +363,7 @@ class MainWindow(ctk.CTk):
         # Subtitle
         self.subtitle_label = ctk.CTkLabel(
             title_frame,
-            text=f"  |  {t('app_subtitle')}",
+            text=f"  |  {self._s.app_subtitle}",
             font=ctk.CTkFont(size=12),
             text_color="gray"
         )
@@ -200,9 +384,8 @@ class MainWindow(ctk.CTk):
             btn = ctk.CTkButton(parent, text=text, height=32, corner_radius=16,
                                 font=btn_font, **kwargs)
             # Measure actual text width using tkinter font
-            tk_font = tkfont.Font(family=btn_font.cget("family"), size=font_size,
-                                  weight=font_weight)
-            text_width = tk_font.measure(text)
+            text_width = measure_text_width(btn_font.cget("family"), font_size,
+                                            font_weight, text)
             # Add minimal padding for button corners
             button_width = text_width + 24  # 12px padding each side
             btn.configure(width=max(button_width, 60))
@@ -211,7 +394,7 @@ class MainWindow(ctk.CTk):
         # Start/Stop button with better styling
         self.start_button = create_button(
             control_frame,
-            text=t('btn_start'),
+            text=self._s.btn_start,
             font_size=12,
             font_weight="bold",
             fg_color="#28a745",
@@ -223,7 +406,7 @@ class MainWindow(ctk.CTk):
         # Statistics button
         self.statistics_button = create_button(
             control_frame,
-            text=t('btn_statistics'),
+            text=self._s.btn_statistics,
             fg_color="#9c27b0",
             hover_color="#7b1fa2",
             command=self._open_statistics
@@ -233,7 +416,7 @@ class MainWindow(ctk.CTk):
         # Settings button
         self.settings_button = create_button(
             control_frame,
-            text=t('btn_settings'),
+            text=self._s.btn_settings,
             fg_color="#6c757d",
             hover_color="#5a6268",
             command=self._open_settings
@@ -243,7 +426,7 @@ class MainWindow(ctk.CTk):
         # About button
         self.about_button = create_button(
             control_frame,
-            text=t('btn_about'),
+            text=self._s.btn_about,
             fg_color="#2196f3",
             hover_color="#1976d2",
             command=self._open_about
@@ -253,7 +436,7 @@ class MainWindow(ctk.CTk):
         # Minimize button
         self.minimize_button = create_button(
             control_frame,
-            text=t('btn_minimize'),
+            text=self._s.btn_minimize,
             fg_color="#17a2b8",
             hover_color="#138496",
             command=self._minimize_to_tray
@@ -267,13 +450,16 @@ class MainWindow(ctk.CTk):
         self.video_frame.grid_columnconfigure(0, weight=1)
         self.video_frame.grid_rowconfigure(0, weight=1)
 
+        # Track the display area size for the preview worker
+        self.video_frame.bind("<Configure>", self._on_video_resize, add="+")
+
         # Preview toggle switch frame (top-right corner of video area)
         self.preview_toggle_frame = ctk.CTkFrame(self.video_frame, fg_color="transparent")
         self.preview_toggle_frame.place(relx=1.0, rely=0, anchor="ne", x=-10, y=10)
 
         self.preview_label = ctk.CTkLabel(
             self.preview_toggle_frame,
-            text=t('preview_label'),
+            text=self._s.preview_label,
             font=ctk.CTkFont(size=12),
             text_color="gray"
         )
@@ -316,7 +502,7 @@ class MainWindow(ctk.CTk):
         # Welcome message
         self.welcome_label = ctk.CTkLabel(
             self.welcome_frame,
-            text=t('camera_preview'),
+            text=self._s.camera_preview,
             font=ctk.CTkFont(size=18, weight="bold")
         )
         self.welcome_label.pack(pady=5)
@@ -324,7 +510,7 @@ class MainWindow(ctk.CTk):
         # Instruction
         self.instruction_label = ctk.CTkLabel(
             self.welcome_frame,
-            text=t('camera_instruction'),
+            text=self._s.camera_instruction,
             font=ctk.CTkFont(size=13),
             text_color="gray"
         )
@@ -360,7 +546,7 @@ class MainWindow(ctk.CTk):
         # Status message
         self.status_label = ctk.CTkLabel(
             status_indicator_frame,
-            text=t('status_standby'),
+            text=self._s.status_standby,
             font=ctk.CTkFont(size=15, weight="bold")
         )
         self.status_label.pack(side="left")
@@ -371,7 +557,7 @@ class MainWindow(ctk.CTk):
 
         self.info_label = ctk.CTkLabel(
             info_frame,
-            text=t('status_standby_desc'),
+            text=self._s.status_standby_desc,
             font=ctk.CTkFont(size=12),
             text_color="gray"
         )
@@ -383,7 +569,7 @@ class MainWindow(ctk.CTk):
 
         self.progress_label = ctk.CTkLabel(
             progress_frame,
-            text=t('detection_progress'),
+            text=self._s.detection_progress,
             font=ctk.CTkFont(size=11),
             text_color="gray"
         )
@@ -399,13 +585,22 @@ class MainWindow(ctk.CTk):
         self.progress_bar.pack()
         self.progress_bar.set(0)
 
+        # Last values applied to the status bar (used to skip no-op configures)
+        self._last_indicator_color: Optional[str] = "gray"
+        self._last_status_text: Optional[str] = self._s.status_standby
+        self._last_info_text: Optional[str] = self._s.status_standby_desc
+        self._last_info_color: Optional[str] = "gray"
+        self._last_progress: float = 0.0
+        self._last_state: Optional[AlertState] = None  # Last state shown by _update_ui
+
     def _create_alert_overlay(self) -> None:
         """Create alert overlay (initially hidden)."""
         self.alert_overlay = ctk.CTkFrame(
             self,
-            fg_color="#dc3545",
+            fg_color=self.OVERLAY_COLOR,
             corner_radius=20
         )
+        self._flash_after_id: Optional[str] = None
 
         # Warning icon
         warning_icon = ctk.CTkLabel(
@@ -417,7 +612,7 @@ class MainWindow(ctk.CTk):
 
         self.alert_label = ctk.CTkLabel(
             self.alert_overlay,
-            text=t('alert_title'),
+            text=self._s.alert_title,
             font=ctk.CTkFont(size=20, weight="bold"),
             text_color="white"
         )
@@ -425,7 +620,7 @@ class MainWindow(ctk.CTk):
 
         self.alert_subtitle = ctk.CTkLabel(
             self.alert_overlay,
-            text=t('alert_subtitle'),
+            text=self._s.alert_subtitle,
             font=ctk.CTkFont(size=14),
             text_color="#ffcccc"
         )
@@ -434,28 +629,24 @@ class MainWindow(ctk.CTk):
         # Dismiss hint
         self.alert_dismiss_hint = ctk.CTkLabel(
             self.alert_overlay,
-            text=t('fullscreen_alert_dismiss'),
+            text=self._s.fullscreen_alert_dismiss,
             font=ctk.CTkFont(size=11),
             text_color="#ff9999"
         )
         self.alert_dismiss_hint.pack(pady=(0, 15))
 
         # Click to dismiss - bind to overlay and all children
-        self.alert_overlay.bind("<Button-1>", lambda e: self._try_hide_alert_popup())
-        warning_icon.bind("<Button-1>", lambda e: self._try_hide_alert_popup())
-        self.alert_label.bind("<Button-1>", lambda e: self._try_hide_alert_popup())
-        self.alert_subtitle.bind("<Button-1>", lambda e: self._try_hide_alert_popup())
-        self.alert_dismiss_hint.bind("<Button-1>", lambda e: self._try_hide_alert_popup())
+        for widget in (self.alert_overlay, warning_icon, self.alert_label,
+                       self.alert_subtitle, self.alert_dismiss_hint):
+            widget.bind("<Button-1>", self._on_overlay_click)
 
     def _load_logo_pil_image(self) -> Image.Image:
         """Load the application logo from icon file as PIL Image."""
-        logo_size = 32
+        logo_size = LOGO_SIZE
         try:
             if APP_ICON_PATH.exists():
-                icon = Image.open(APP_ICON_PATH)
-                if icon.mode != 'RGBA':
-                    icon = icon.convert('RGBA')
-                return icon.resize((logo_size, logo_size), Image.Resampling.LANCZOS)
+                mtime = APP_ICON_PATH.stat().st_mtime
+                return _load_logo_cached(str(APP_ICON_PATH), mtime)
         except Exception as e:
             print(f"Failed to load logo icon: {e}")
 
@@ -477,21 +668,25 @@ class MainWindow(ctk.CTk):
         if self._is_running:
             return
 
+        # Apply a changed model complexity before the capture thread starts
+        if self._model_complexity != self.settings.model_complexity:
+            self._recreate_trackers()
+
         if not self.camera.start():
-            self.status_label.configure(text=t('camera_error'))
-            self.status_indicator.configure(text_color="red")
-            self.info_label.configure(text=t('camera_error_help'), text_color="#dc3545")
+            self._set_status("red", self._s.camera_error, self._s.camera_error_help, "#dc3545")
             return
 
         self._is_running = True
-        self._update_button_width(self.start_button, t('btn_stop'))
+        # Fresh event per session: a previous capture loop still finishing a
+        # read keeps seeing its own (set) event and exits
+        self._stop_event = threading.Event()
+        self._update_button_width(self.start_button, self._s.btn_stop)
         self.start_button.configure(
             fg_color="#dc3545",
             hover_color="#c82333"
         )
-        self.status_indicator.configure(text_color="#28a745")
-        self.status_label.configure(text=t('status_monitoring'))
-        self.info_label.configure(text=t('status_monitoring_desc'), text_color="gray")
+        self._set_status("#28a745", self._s.status_monitoring, self._s.status_monitoring_desc, "gray")
+        self._last_state = None
 
         # Show preview toggle switch
         self.preview_toggle_frame.place(relx=1.0, rely=0, anchor="ne", x=-10, y=10)
@@ -502,33 +697,52 @@ class MainWindow(ctk.CTk):
         self.video_label.grid()
 
         # Start update thread
-        self._update_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._update_thread = threading.Thread(
+            target=self._capture_loop, args=(self._stop_event,), daemon=True
+        )
         self._update_thread.start()
 
+        # Start preview resize worker (a previous session's worker may still be
+        # winding down; it stops at its own stop event and has its own buffers)
+        with self._frame_lock:
+            self._ready_image = None
+        self._preview_consumed.set()
+        self._preview_stop = threading.Event()
+        self._preview_thread = threading.Thread(
+            target=self._preview_loop, args=(self._preview_stop,), daemon=True
+        )
+        self._preview_thread.start()
+
         # Start UI update
-        self._update_ui()
+        self._ui_pending.clear()
+        self._ui_watchdog()
 
     def _stop_monitoring(self) -> None:
         """Stop camera monitoring."""
         self._is_running = False
+        self._stop_event.set()
+        if self._preview_stop is not None:
+            self._preview_stop.set()
         self.camera.stop()
+        if self._ui_watchdog_id is not None:
+            self.after_cancel(self._ui_watchdog_id)
+            self._ui_watchdog_id = None
 
-        self._update_button_width(self.start_button, t('btn_start'))
+        self._update_button_width(self.start_button, self._s.btn_start)
         self.start_button.configure(
             fg_color="#28a745",
             hover_color="#218838"
         )
-        self.status_indicator.configure(text_color="gray")
-        self.status_label.configure(text=t('status_standby'))
-        self.info_label.configure(text=t('status_standby_desc'), text_color="gray")
-        self.progress_bar.set(0)
+        self._set_status("gray", self._s.status_standby, self._s.status_standby_desc, "gray")
+        self._last_state = None
+        self._set_progress(0.0)
 
         # Hide preview toggle switch
         self.preview_toggle_frame.place_forget()
 
         # Show welcome frame, hide video label
-        # Recreate video_label to avoid TclError with stale image references
-        self._recreate_video_label()
+        # Clear video_label to avoid TclError with stale image references
+        self._clear_video_label()
         self.video_label.grid_remove()
         self.welcome_frame.grid()
 
@@ -569,7 +783,7 @@ class MainWindow(ctk.CTk):
 
         self.placeholder_status_text = ctk.CTkLabel(
             status_frame,
-            text=t('preview_off_status'),
+            text=self._s.preview_off_status,
             font=ctk.CTkFont(size=14, weight="bold"),
             text_color="#28a745"
         )
@@ -578,7 +792,7 @@ class MainWindow(ctk.CTk):
         # Main message
         self.placeholder_message = ctk.CTkLabel(
             placeholder_content,
-            text=t('preview_off_message'),
+            text=self._s.preview_off_message,
             font=ctk.CTkFont(size=16),
             text_color=("gray40", "gray60")
         )
@@ -587,7 +801,7 @@ class MainWindow(ctk.CTk):
         # CPU saving hint
         self.placeholder_hint = ctk.CTkLabel(
             placeholder_content,
-            text=t('preview_off_hint'),
+            text=self._s.preview_off_hint,
             font=ctk.CTkFont(size=12),
             text_color=("gray50", "gray50"),
             wraplength=400
@@ -629,7 +843,7 @@ class MainWindow(ctk.CTk):
             # Tooltip content
             tooltip_label = ctk.CTkLabel(
                 tooltip_frame,
-                text=t('preview_tooltip'),
+                text=self._s.preview_tooltip,
                 font=ctk.CTkFont(size=11),
                 text_color="white",
                 wraplength=250,
@@ -666,7 +880,7 @@ class MainWindow(ctk.CTk):
 
         if not self._preview_enabled:
             # Hide video label and welcome frame, show placeholder
-            self._recreate_video_label()
+            self._clear_video_label()
             self.video_label.grid_remove()
             self.welcome_frame.grid_remove()
             self.preview_placeholder_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
@@ -676,53 +890,81 @@ class MainWindow(ctk.CTk):
             # Hide placeholder and welcome frame, show video label
             self.preview_placeholder_frame.grid_remove()
             self.welcome_frame.grid_remove()
-            self._recreate_video_label()
+            self._clear_video_label()
             self.video_label.grid()
             # Raise preview toggle above video
             self.preview_toggle_frame.lift()
 
-    def _recreate_video_label(self) -> None:
-        """Recreate video_label to avoid TclError with stale image references."""
-        # Destroy old label
-        if hasattr(self, 'video_label') and self.video_label is not None:
-            self.video_label.destroy()
+    def _clear_video_label(self) -> None:
+        """Detach the preview image from video_label to avoid TclError with stale image references.
 
-        # Create new label
-        self.video_label = ctk.CTkLabel(
-            self.video_frame,
-            text=""
-        )
-        self.video_label.grid(row=0, column=0)
+        The label is kept instead of being destroyed and recreated, which
+        avoids a widget rebuild and relayout on every preview toggle/stop.
+        An empty string (unlike None) is passed through to the Tk label.
+        """
+        self.video_label.configure(image="", text="")
+        self.video_label._image = None
+        self._photo = None  # Next frame creates and attaches a new photo
 
-    def _capture_loop(self) -> None:
-        """Background thread for frame capture and processing."""
-        while self._is_running:
-            self._frame_count += 1
+    def _capture_loop(self, stop_event: threading.Event) -> None:
+        """Background thread for frame capture and processing.
 
-            # Frame skip for performance
-            if self._frame_count % self.settings.frame_skip != 0:
-                time.sleep(0.01)
-                continue
+        Runs until its own session's stop event is set.
+        """
+        frame_interval = 1.0 / self.camera.fps
+        rgb_buf: Optional[np.ndarray] = None  # Reused cvtColor destination
+        prev_thumb: Optional[np.ndarray] = None  # Thumbnail of last processed frame
+        skipped = 0
+        hands = head = None
+
+        while not stop_event.is_set():
+            loop_start = time.perf_counter()
+
+            # Frame skip for performance: grab() discards frames without decoding
+            for _ in range(self.settings.frame_skip - 1):
+                self.camera.grab()
 
             ret, frame_bgr = self.camera.read_frame()
             if not ret or frame_bgr is None:
+                stop_event.wait(0.01)
                 continue
 
-            # Convert to RGB for MediaPipe
-            frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-
-            # Process with MediaPipe (always needed for detection)
-            hands = self.hand_tracker.process(frame_rgb)
-            head = self.pose_tracker.process(frame_rgb)
-
-            # Analyze proximity (always needed for alerts)
+            # Reuse the previous landmarks while the scene is static
+            thumb = cv2.cvtColor(
+                cv2.resize(frame_bgr, self.MOTION_THUMB_SIZE, interpolation=cv2.INTER_AREA),
+                cv2.COLOR_BGR2GRAY
+            )
+            if (prev_thumb is not None and skipped < self.MOTION_MAX_SKIP
+                    and cv2.mean(cv2.absdiff(thumb, prev_thumb))[0] < self.MOTION_THRESHOLD):
+                skipped += 1
+            else:
+                skipped = 0
+                prev_thumb = thumb
+
+                # Convert to RGB for MediaPipe into a reused buffer; MediaPipe
+                # gets a read-only view so it can skip a copy
+                if rgb_buf is None or rgb_buf.shape != frame_bgr.shape:
+                    rgb_buf = np.empty_like(frame_bgr)
+                cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                frame_rgb = rgb_buf.view()
+                frame_rgb.flags.writeable = False
+
+                # Process with MediaPipe
+                hands = self.hand_tracker.process(frame_rgb)
+                head = self.pose_tracker.process(frame_rgb)
+
+            # Analyze proximity (always needed for alerts, so the trigger
+            # timer keeps running while a hand rests near the head)
             result = self.analyzer.analyze(hands, head)
 
-            # Only do visual processing if preview is enabled
+            # Only do visual processing if preview is enabled and on screen
             # This saves CPU by skipping: drawing, overlay, color conversion, frame storage
-            if self._preview_enabled:
-                # Draw visualizations
-                display_frame = frame_bgr.copy()
+            if self._preview_enabled and self._preview_visible:
+                # Draw visualizations. read_frame returns a fresh (flipped)
+                # array each call, so no defensive copy is needed here: the
+                # landmark drawers copy only when they actually draw and the
+                # status overlay is blended in place
+                display_frame = frame_bgr
 
                 # Draw hand landmarks
                 if hands:
@@ -735,149 +977,324 @@ class MainWindow(ctk.CTk):
                 # Add status overlay
                 display_frame = self._draw_status_overlay(display_frame, result)
 
-                # Convert for display
-                display_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-
-                with self._frame_lock:
-                    self._current_frame = display_rgb
-                    self._current_result = result
+                # Stored as BGR: the preview worker swaps channels while
+                # decoding the downscaled image, not on the full frame
+                self._current_frame = display_frame
+                self._result_queue.put(result)
+                self._preview_frame_event.set()
+                self._notify_ui()
             else:
                 # Only store result for status bar updates (no frame processing)
-                with self._frame_lock:
-                    self._current_frame = None
-                    self._current_result = result
-
-            time.sleep(0.01)
-
-    def _draw_status_overlay(self, frame: np.ndarray, result) -> np.ndarray:
-        """Draw status information on frame with Korean text support."""
-        h, w = frame.shape[:2]
-
-        # Background for text
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 10), (280, 75), (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
-
-        # Convert BGR to RGB for PIL
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(frame_rgb)
-        draw = ImageDraw.Draw(pil_image)
-
-        # Try to load Korean font
+                self._current_frame = None
+                self._result_queue.put(result)
+                self._notify_ui()
+
+            # read_frame already blocks until the camera delivers a frame;
+            # only wait out what is left of the frame interval
+            remaining = frame_interval - (time.perf_counter() - loop_start)
+            if remaining > 0:
+                stop_event.wait(remaining)
+
+    def _warmup(self) -> None:
+        """Prepare overlay resources off the UI thread before Start is clicked."""
+        self._load_fonts()
+        self._warmup_done.set()
+
+    def _load_fonts(self) -> None:
+        """Load the overlay fonts once (with Korean text support)."""
         try:
             # Windows Korean fonts
-            font_large = ImageFont.truetype("malgun.ttf", 18)
-            font_small = ImageFont.truetype("malgun.ttf", 14)
+            self._font_large = ImageFont.truetype("malgun.ttf", 18)
+            self._font_small = ImageFont.truetype("malgun.ttf", 14)
         except OSError:
             try:
                 # Alternative: Windows Gothic
-                font_large = ImageFont.truetype("msgothic.ttc", 18)
-                font_small = ImageFont.truetype("msgothic.ttc", 14)
+                self._font_large = ImageFont.truetype("msgothic.ttc", 18)
+                self._font_small = ImageFont.truetype("msgothic.ttc", 14)
             except OSError:
                 # Fallback to default
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
+                self._font_large = ImageFont.load_default()
+                self._font_small = ImageFont.load_default()
+
+    def _render_overlay_sprite(self, state: AlertState, message: str,
+                               dist_text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Render the status box once as a (keep, premultiplied BGR) pair."""
+        x1, y1, x2, y2 = self.STATUS_BOX
+        sprite = Image.new("RGBA", (x2 - x1 + 1, y2 - y1 + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+
+        color = STATE_OVERLAY_COLORS.get(state, STATE_OVERLAY_COLORS[AlertState.IDLE])
+
+        # Same positions as before, relative to the box origin
+        draw.text((20 - x1, 18 - y1), message, font=self._font_large, fill=color + (255,))
+        draw.text((20 - x1, 45 - y1), dist_text, font=self._font_small, fill=(255, 255, 255, 255))
+
+        rgba = np.asarray(sprite, dtype=np.float32) / 255.0
+        text_alpha = rgba[:, :, 3:4]
+        # The black box is 60% opaque; glyphs are drawn fully opaque on top
+        alpha = 0.6 + 0.4 * text_alpha
+        # +0.5 so the truncating uint8 store rounds like cv2.addWeighted
+        premultiplied = rgba[:, :, 2::-1] * text_alpha * 255.0 + 0.5
+        return 1.0 - alpha, premultiplied
 
-        # Status text color (RGB for PIL)
-        color = (0, 255, 0)  # Green
-        if result.state == AlertState.DETECTING:
-            color = (255, 255, 0)  # Yellow
-        elif result.state == AlertState.ALERT:
-            color = (255, 0, 0)  # Red
-        elif result.state == AlertState.COOLDOWN:
-            color = (128, 128, 128)  # Gray
+    def _draw_status_overlay(self, frame: np.ndarray, result) -> np.ndarray:
+        """Draw status information on frame with Korean text support.
+
+        The text box is rendered once per distinct (state, message, distance)
+        with PIL and alpha-blended into the frame in place afterwards.
+        """
+        if not self._warmup_done.is_set():
+            return frame  # Fonts still loading: show the frame without text
+
+        # Quantize to 0.05 steps so the text (and the sprite key) only
+        # changes when the distance changes perceptibly
+        bucket = round(result.closest_distance * 20)
+        if bucket != self._last_dist_bucket:
+            self._last_dist_bucket = bucket
+            self._last_dist_text = self._s.distance_label.replace("{value:.2f}", f"{bucket / 20:.2f}")
+        dist_text = self._last_dist_text
+        key = (result.state, result.message, dist_text)
+
+        cache = self._overlay_cache
+        sprite = cache.get(key)
+        if sprite is None:
+            sprite = self._render_overlay_sprite(result.state, result.message, dist_text)
+            cache[key] = sprite
+            if len(cache) > self.STATUS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
 
-        # Draw status message
-        draw.text((20, 18), result.message, font=font_large, fill=color)
+        keep, premultiplied = sprite
+        x1, y1, x2, y2 = self.STATUS_BOX
+        roi = frame[y1:y2 + 1, x1:x2 + 1]
+        rh, rw = roi.shape[:2]
+        blended = roi * keep[:rh, :rw] + premultiplied[:rh, :rw]
+        np.copyto(roi, blended, casting='unsafe')
 
-        # Distance indicator - format the value into the translation
-        dist_text = t('distance_label').replace("{value:.2f}", f"{result.closest_distance:.2f}")
-        draw.text((20, 45), dist_text, font=font_small, fill=(255, 255, 255))
+        return frame
 
-        # Convert back to BGR for OpenCV
-        frame = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+    def _notify_ui(self) -> None:
+        """Ask the UI thread to run _update_ui (called from worker threads).
 
-        return frame
+        Only one <<NewFrame>> event is queued at a time; further frames
+        arriving before it is handled are picked up by the same update.
+        """
+        if self._ui_pending.is_set():
+            return
+        self._ui_pending.set()
+        try:
+            self.event_generate("<<NewFrame>>", when="tail")
+        except (RuntimeError, TclError):
+            # Window closing or main loop not running; let the next frame retry
+            self._ui_pending.clear()
+
+    def _update_ui_event(self, event=None) -> None:
+        """Handle <<NewFrame>> from the worker threads."""
+        self._update_ui()
+
+    def _ui_watchdog(self) -> None:
+        """Run _update_ui periodically in case no <<NewFrame>> arrives."""
+        if not self._is_running:
+            self._ui_watchdog_id = None
+            return
+        self._update_ui()
+        self._ui_watchdog_id = self.after(self.UI_WATCHDOG_MS, self._ui_watchdog)
 
     def _update_ui(self) -> None:
         """Update UI with current frame (called from main thread)."""
+        # Any update (event or watchdog) picks up the frames a queued
+        # <<NewFrame>> stood for, so workers may post a new one
+        self._ui_pending.clear()
+
         if not self._is_running:
             return
 
         with self._frame_lock:
-            frame = self._current_frame
-            result = getattr(self, '_current_result', None)
-
-        if frame is not None:
-            # Get actual display area size
-            self.video_frame.update_idletasks()
-            display_width = self.video_frame.winfo_width() - 20
-            display_height = self.video_frame.winfo_height() - 20
-
-            if display_width > 100 and display_height > 100:
-                h, w = frame.shape[:2]
-
-                # Calculate scale to fit within display area while maintaining aspect ratio
-                scale_w = display_width / w
-                scale_h = display_height / h
-                scale = min(scale_w, scale_h)
-
-                # Calculate new dimensions
-                new_w = int(w * scale)
-                new_h = int(h * scale)
-
-                # Ensure valid dimensions
-                if new_w > 0 and new_h > 0:
-                    # Resize frame first using OpenCV
-                    if scale < 1.0:
-                        frame_resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
-                    else:
-                        frame_resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-
-                    # Convert to PIL Image (already resized)
-                    image = Image.fromarray(frame_resized)
-
-                    # Use ImageTk.PhotoImage directly for accurate sizing
-                    photo = ImageTk.PhotoImage(image)
-
-                    try:
-                        self.video_label.configure(image=photo, text="")
-                        self.video_label._image = photo  # Keep reference
-                    except Exception:
-                        pass  # Ignore if label is being recreated
-
-        if result is not None:
-            # Update status bar based on state
-            if result.state == AlertState.IDLE:
-                self.status_indicator.configure(text_color="#28a745")
-                self.status_label.configure(text=t('status_normal'))
-                self.info_label.configure(text=t('status_normal_desc'), text_color="#28a745")
-            elif result.state == AlertState.DETECTING:
-                self.status_indicator.configure(text_color="#ffc107")
-                self.status_label.configure(text=t('status_detecting'))
-                self.info_label.configure(text=t('status_detecting_desc'), text_color="#ffc107")
-            elif result.state == AlertState.ALERT:
-                self.status_indicator.configure(text_color="#dc3545")
-                self.status_label.configure(text=t('status_warning'))
-                self.info_label.configure(text=t('status_warning_desc'), text_color="#dc3545")
-            elif result.state == AlertState.COOLDOWN:
-                self.status_indicator.configure(text_color="#6c757d")
-                self.status_label.configure(text=t('status_cooldown'))
-                self.info_label.configure(text=t('status_cooldown_desc'), text_color="#6c757d")
+            image = self._ready_image
+            self._ready_image = None
+        result = self._get_latest_result()
+
+        if image is not None:
+            photo = self._photo
+            if photo is None or photo.width() != image.width or photo.height() != image.height:
+                # Use ImageTk.PhotoImage directly for accurate sizing
+                photo = ImageTk.PhotoImage(image)
+                try:
+                    self.video_label.configure(image=photo, text="")
+                    self.video_label._image = photo  # Keep reference
+                    self._photo = photo
+                except Exception:
+                    pass  # Ignore if label is being recreated
+            else:
+                # Same size: update the existing Tk photo in place
+                photo.paste(image)
+            # The pixels are copied into Tk, so the worker may reuse the buffer
+            self._preview_consumed.set()
+
+        # Status work is skipped entirely while no new result has arrived
+        if result is not None and result is not self._last_result:
+            self._last_result = result
+
+            state = result.state
+
+            # Update status bar only when the state changes
+            if state is not self._last_state:
+                self._last_state = state
+                color, status_text, desc_text = self._state_ui[state]
+                self._set_status(color, status_text, desc_text, color)
 
             # Update progress bar
-            if result.state == AlertState.DETECTING:
+            if state is AlertState.DETECTING:
                 progress = 1 - (result.time_until_alert / self.settings.trigger_time)
-                self.progress_bar.set(progress)
+                self._set_progress(progress)
             else:
-                self.progress_bar.set(0)
+                self._set_progress(0.0)
+
+        # Auto-dismiss alert when hand moves away from face
+        if result is not None and self._alert_showing and not result.is_hand_near_head:
+            self._auto_dismiss_alert()
+
+    def _on_video_resize(self, event) -> None:
+        """Store the available preview area when the video frame is resized."""
+        self._preview_size = (event.width - 20, event.height - 20)
+
+    def _get_preview_target(self, w: int, h: int,
+                            size: Tuple[int, int]) -> Tuple[int, int]:
+        """Get the preview size for a frame, recomputed only when inputs change."""
+        target = self._preview_target
+        if target is None or target[:4] != (w, h, size[0], size[1]):
+            display_width, display_height = size
+
+            # Scale to fit within display area while maintaining aspect ratio
+            scale = min(display_width / w, display_height / h)
+            target = (w, h, size[0], size[1], int(w * scale), int(h * scale))
+            self._preview_target = target
+        return target[4], target[5]
+
+    def _preview_loop(self, stop: threading.Event) -> None:
+        """Background thread that resizes captured frames for the preview.
+
+        Runs until its own session's stop event is set.
+        """
+        # This session's resize destinations, written alternately
+        buffers: List[Optional[np.ndarray]] = [None, None]
+        buffer_index = 0
+        while not stop.is_set():
+            if not self._preview_frame_event.wait(timeout=0.1):
+                continue
+            self._preview_frame_event.clear()
+
+            frame = self._current_frame
+            size = self._preview_size
+            if frame is None or size is None:
+                continue
 
-            # Auto-dismiss alert when hand moves away from face
-            if self._alert_showing and not result.is_hand_near_head:
-                self._auto_dismiss_alert()
+            image = self._resize_preview(frame, size, buffers, buffer_index)
+            if image is None:
+                continue
 
-        # Schedule next update
-        self.after(33, self._update_ui)  # ~30 FPS
+            # Wait until the UI thread has taken the previous image, so the
+            # buffer written next is never one it may still be reading
+            while not stop.is_set() and not self._preview_consumed.wait(timeout=0.1):
+                pass
+            if stop.is_set():
+                break
+            self._preview_consumed.clear()
+
+            with self._frame_lock:
+                # Checked under the lock so a stopped session never publishes
+                if stop.is_set():
+                    break
+                self._ready_image = image
+            buffer_index ^= 1
+            self._notify_ui()
+
+    def _resize_preview(self, frame: np.ndarray, size: Tuple[int, int],
+                        buffers: List[Optional[np.ndarray]],
+                        buffer_index: int) -> Optional[Image.Image]:
+        """Resize a BGR frame to fit the display size and return it as an RGB PIL Image.
+
+        Returns None if the display area is too small to show a preview.
+        """
+        display_width, display_height = size
+        if display_width <= 100 or display_height <= 100:
+            return None
+
+        h, w = frame.shape[:2]
+        new_w, new_h = self._get_preview_target(w, h, size)
+        if new_w <= 0 or new_h <= 0:
+            return None
+
+        # PIL's raw decoder reads BGR directly and swaps channels during its
+        # single copy, so no separate cv2.cvtColor pass is needed
+        if new_w == w and new_h == h:
+            # Display fits the frame exactly: no resize needed
+            return Image.frombuffer("RGB", (w, h), frame, "raw", "BGR", 0, 1)
+
+        low_power = self.settings.low_power_preview
+
+        if RESIZE_BACKEND == "pil" and new_w >= w and not low_power:
+            # Pillow-SIMD's BILINEAR path beats cv2 for upscaling
+            image = Image.frombuffer("RGB", (w, h), frame, "raw", "BGR", 0, 1)
+            return image.resize((new_w, new_h), Image.Resampling.BILINEAR)
+
+        # Reuse the resize destination buffer while the size is unchanged
+        buf = buffers[buffer_index]
+        if buf is None or buf.shape[0] != new_h or buf.shape[1] != new_w:
+            buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            buffers[buffer_index] = buf
+
+        # Resize using OpenCV, straight into the buffer: INTER_AREA gives the
+        # best quality when shrinking, INTER_LINEAR is cheaper when enlarging,
+        # INTER_NEAREST is the cheapest of all in low-power preview mode
+        if low_power:
+            interpolation = cv2.INTER_NEAREST
+        else:
+            interpolation = cv2.INTER_AREA if new_w < w else cv2.INTER_LINEAR
+        cv2.resize(frame, (new_w, new_h), dst=buf, interpolation=interpolation)
+
+        return Image.frombuffer("RGB", (new_w, new_h), buf, "raw", "BGR", 0, 1)
+
+    def _build_state_ui(self) -> dict:
+        """Resolve the status bar (color, text, description) for each analyzer state."""
+        return {
+            state: (color, getattr(self._s, status_key), getattr(self._s, desc_key))
+            for state, (color, status_key, desc_key) in STATE_STATUS_STYLES.items()
+        }
+
+    def _set_status(self, indicator_color: Optional[str] = None,
+                    status_text: Optional[str] = None,
+                    info_text: Optional[str] = None,
+                    info_color: Optional[str] = None) -> None:
+        """Update status bar widgets, skipping values that haven't changed.
+
+        Each configure() is a Tcl round-trip, so unchanged values are not
+        forwarded. Arguments left as None keep their current value.
+        """
+        if indicator_color is not None and indicator_color != self._last_indicator_color:
+            self.status_indicator.configure(text_color=indicator_color)
+            self._last_indicator_color = indicator_color
+
+        if status_text is not None and status_text != self._last_status_text:
+            self.status_label.configure(text=status_text)
+            self._last_status_text = status_text
+
+        info_changes = {}
+        if info_text is not None and info_text != self._last_info_text:
+            info_changes['text'] = info_text
+            self._last_info_text = info_text
+        if info_color is not None and info_color != self._last_info_color:
+            info_changes['text_color'] = info_color
+            self._last_info_color = info_color
+        if info_changes:
+            self.info_label.configure(**info_changes)
+
+    def _set_progress(self, value: float) -> None:
+        """Update the detection progress bar if the value changed noticeably."""
+        if value != self._last_progress and (value == 0.0 or abs(value - self._last_progress) > 0.01):
+            self.progress_bar.set(value)
+            self._last_progress = value
 
     def _on_alert_triggered(self) -> None:
         """Handle alert trigger from analyzer - skip if alert already showing."""
@@ -911,11 +1328,19 @@ class MainWindow(ctk.CTk):
         # Show the fullscreen alert
         self._fullscreen_alert.show_alert()
 
+    def _get_latest_result(self) -> Optional[AnalysisResult]:
+        """Drain published results and return the most recent one (UI thread only)."""
+        result_queue = self._result_queue
+        while True:
+            try:
+                self._ui_result = result_queue.get_nowait()
+            except queue.Empty:
+                return self._ui_result
+
     def _can_dismiss_alert(self) -> bool:
         """Check if alert can be dismissed (hand is not near face)."""
         # Get latest analysis result
-        with self._frame_lock:
-            result = getattr(self, '_current_result', None)
+        result = self._get_latest_result()
 
         if result is None:
             return True  # No result, allow dismiss
@@ -923,6 +1348,10 @@ class MainWindow(ctk.CTk):
         # Allow dismiss only if hand is not near head
         return not result.is_hand_near_head
 
+    def _on_overlay_click(self, event) -> None:
+        """Handle click on the alert overlay."""
+        self._try_hide_alert_popup()
+
     def _try_hide_alert_popup(self) -> None:
         """Try to hide alert overlay, checking if hand is still near face."""
         if not self._can_dismiss_alert():
@@ -936,32 +1365,43 @@ class MainWindow(ctk.CTk):
         """Show visual feedback that overlay alert cannot be dismissed."""
         # Update hint text
         self.alert_dismiss_hint.configure(
-            text=t('fullscreen_alert_move_hand'),
+            text=self._s.fullscreen_alert_move_hand,
             text_color="#ffff00"
         )
 
         # Flash effect - briefly change background
-        original_color = "#dc3545"
-        flash_color = "#ff0000"
-
-        self.alert_overlay.configure(fg_color=flash_color)
-        self.after(100, lambda: self.alert_overlay.configure(fg_color=original_color))
-        self.after(200, lambda: self.alert_overlay.configure(fg_color=flash_color))
-        self.after(300, lambda: self.alert_overlay.configure(fg_color=original_color))
+        self._cancel_overlay_flash()
+        self._flash_step(0)
 
         # Restore hint text after delay
         self.after(1500, self._restore_overlay_dismiss_hint)
 
+    def _flash_step(self, index: int) -> None:
+        """Apply one step of the overlay flash animation and schedule the next."""
+        self.alert_overlay.configure(fg_color=self.OVERLAY_FLASH_SEQUENCE[index])
+        if index + 1 < len(self.OVERLAY_FLASH_SEQUENCE):
+            self._flash_after_id = self.after(100, self._flash_step, index + 1)
+        else:
+            self._flash_after_id = None
+
+    def _cancel_overlay_flash(self) -> None:
+        """Cancel a running overlay flash animation and restore the color."""
+        if self._flash_after_id is not None:
+            self.after_cancel(self._flash_after_id)
+            self._flash_after_id = None
+            self.alert_overlay.configure(fg_color=self.OVERLAY_COLOR)
+
     def _restore_overlay_dismiss_hint(self) -> None:
         """Restore overlay dismiss hint to original text."""
         self.alert_dismiss_hint.configure(
-            text=t('fullscreen_alert_dismiss'),
+            text=self._s.fullscreen_alert_dismiss,
             text_color="#ff9999"
         )
 
     def _hide_alert_popup(self) -> None:
         """Hide alert overlay."""
         self._alert_showing = False
+        self._cancel_overlay_flash()
         self.alert_overlay.place_forget()
 
         # Also hide fullscreen alert if showing
@@ -973,6 +1413,7 @@ class MainWindow(ctk.CTk):
         self._alert_showing = False
 
         # Hide overlay alert
+        self._cancel_overlay_flash()
         self.alert_overlay.place_forget()
 
         # Hide fullscreen alert
@@ -998,6 +1439,7 @@ class MainWindow(ctk.CTk):
         """Minimize to system tray."""
         if self._on_minimize_to_tray:
             self._on_minimize_to_tray()
+        self._preview_visible = False
         self.withdraw()
 
     def set_on_minimize_to_tray(self, callback: Callable) -> None:
@@ -1022,6 +1464,7 @@ class MainWindow(ctk.CTk):
 
     def show_window(self) -> None:
         """Show the window (from tray)."""
+        self._preview_visible = True
         self.deiconify()
         self.lift()
         self.focus_force()
@@ -1036,59 +1479,75 @@ class MainWindow(ctk.CTk):
         self.alert_manager.set_sound_enabled(self.settings.sound_enabled)
         self.alert_manager.set_popup_enabled(self.settings.popup_enabled)
 
+        # Model complexity needs new MediaPipe graphs; while monitoring this is
+        # deferred to the next start so the capture thread is not disturbed
+        if not self._is_running and self._model_complexity != self.settings.model_complexity:
+            self._recreate_trackers()
+
+    def _recreate_trackers(self) -> None:
+        """Rebuild MediaPipe trackers with the configured model complexity."""
+        self.hand_tracker.close()
+        self.pose_tracker.close()
+        self._model_complexity = self.settings.model_complexity
+        self.hand_tracker = HandTracker(model_complexity=self._model_complexity)
+        self.pose_tracker = PoseTracker(model_complexity=self._model_complexity)
+
     def _update_button_width(self, button: ctk.CTkButton, text: str) -> None:
         """Update button text and auto-calculate width using font measurement."""
         button.configure(text=text)
         # Get font from button and measure actual text width
         btn_font = button.cget("font")
         if isinstance(btn_font, ctk.CTkFont):
-            tk_font = tkfont.Font(family=btn_font.cget("family"),
-                                  size=btn_font.cget("size"),
-                                  weight=btn_font.cget("weight"))
+            text_width = measure_text_width(btn_font.cget("family"),
+                                            btn_font.cget("size"),
+                                            btn_font.cget("weight"), text)
         else:
-            tk_font = tkfont.Font(size=11)
-        text_width = tk_font.measure(text)
+            text_width = measure_text_width(None, 11, "normal", text)
         button_width = text_width + 24  # Match compact padding from create_button
         button.configure(width=max(button_width, 60))
 
     def update_language(self) -> None:
         """Update UI text after language change."""
+        self._s = build_ui_strings()
+        self._state_ui = self._build_state_ui()
+        self._last_state = None  # Re-apply status text in the new language
+        self._last_dist_bucket = None  # Re-format the overlay distance text
+
         # Title
-        self.title_label.configure(text=t('app_title'))
-        self.subtitle_label.configure(text=f"  |  {t('app_subtitle')}")
+        self.title_label.configure(text=self._s.app_title)
+        self.subtitle_label.configure(text=f"  |  {self._s.app_subtitle}")
 
         # Buttons - update with auto-width calculation
         if self._is_running:
-            self._update_button_width(self.start_button, t('btn_stop'))
+            self._update_button_width(self.start_button, self._s.btn_stop)
         else:
-            self._update_button_width(self.start_button, t('btn_start'))
-        self._update_button_width(self.statistics_button, t('btn_statistics'))
-        self._update_button_width(self.settings_button, t('btn_settings'))
-        self._update_button_width(self.about_button, t('btn_about'))
-        self._update_button_width(self.minimize_button, t('btn_minimize'))
+            self._update_button_width(self.start_button, self._s.btn_start)
+        self._update_button_width(self.statistics_button, self._s.btn_statistics)
+        self._update_button_width(self.settings_button, self._s.btn_settings)
+        self._update_button_width(self.about_button, self._s.btn_about)
+        self._update_button_width(self.minimize_button, self._s.btn_minimize)
 
         # Welcome screen
-        self.welcome_label.configure(text=t('camera_preview'))
-        self.instruction_label.configure(text=t('camera_instruction'))
+        self.welcome_label.configure(text=self._s.camera_preview)
+        self.instruction_label.configure(text=self._s.camera_instruction)
 
         # Status bar
         if not self._is_running:
-            self.status_label.configure(text=t('status_standby'))
-            self.info_label.configure(text=t('status_standby_desc'))
-        self.progress_label.configure(text=t('detection_progress'))
+            self._set_status(status_text=self._s.status_standby, info_text=self._s.status_standby_desc)
+        self.progress_label.configure(text=self._s.detection_progress)
 
         # Alert overlay
-        self.alert_label.configure(text=t('alert_title'))
-        self.alert_subtitle.configure(text=t('alert_subtitle'))
-        self.alert_dismiss_hint.configure(text=t('fullscreen_alert_dismiss'))
+        self.alert_label.configure(text=self._s.alert_title)
+        self.alert_subtitle.configure(text=self._s.alert_subtitle)
+        self.alert_dismiss_hint.configure(text=self._s.fullscreen_alert_dismiss)
 
         # Preview toggle
-        self.preview_label.configure(text=t('preview_label'))
+        self.preview_label.configure(text=self._s.preview_label)
 
         # Preview placeholder
-        self.placeholder_status_text.configure(text=t('preview_off_status'))
-        self.placeholder_message.configure(text=t('preview_off_message'))
-        self.placeholder_hint.configure(text=t('preview_off_hint'))
+        self.placeholder_status_text.configure(text=self._s.preview_off_status)
+        self.placeholder_message.configure(text=self._s.preview_off_message)
+        self.placeholder_hint.configure(text=self._s.preview_off_hint)
 
         # Fullscreen alert
         if self._fullscreen_alert is not None:
@@ -1112,4 +1571,5 @@ class MainWindow(ctk.CTk):
         self._stop_monitoring()
         self.hand_tracker.close()
         self.pose_tracker.close()
+        self.alert_manager.close()
         self.destroy()
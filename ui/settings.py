@@ -1,18 +1,42 @@
 """Settings window UI."""
+import re
 import customtkinter as ctk
+from dataclasses import asdict
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from utils import Config
+from utils.config import AppConfig
 from utils.startup import StartupManager
-from utils.i18n import t, get_language, set_language, get_supported_languages, SUPPORTED_LANGUAGES
+from utils.i18n import (t, get_language, set_language, get_supported_languages, init_language,
+                        SUPPORTED_LANGUAGES, LANGUAGE_CODES, LANGUAGE_NAMES)
 
 APP_ICON_PATH = Path(__file__).parent.parent / "assets" / "icon.ico"
 
+# Default settings used by Reset (read-only, never saved or mutated)
+DEFAULT_SETTINGS = AppConfig()
+
 
 class SettingsWindow(ctk.CTkToplevel):
     """Settings configuration window."""
 
+    # Slider value labels are refreshed at most this often while dragging (ms)
+    SLIDER_LABEL_DELAY_MS = 60
+
+    # Slider value label formatters (bound once instead of per callback)
+    _FMT_SENSITIVITY = "{:.2f}".format
+    _FMT_TRIGGER = "{:.1f}".format
+    _FMT_COOLDOWN = "{:.0f}".format
+    _FMT_FRAMESKIP = "{:.0f}".format
+
+    # Initial window size
+    WIDTH = 450
+    HEIGHT = 680
+
+    # Shared fonts, created once on first use (needs a Tk root)
+    _HEADER_FONT: Optional[ctk.CTkFont] = None
+    _HELP_FONT: Optional[ctk.CTkFont] = None
+
     def __init__(self, parent: ctk.CTk, config: Config,
                  on_save: Optional[Callable] = None,
                  on_language_change: Optional[Callable] = None):
@@ -23,28 +47,47 @@ class SettingsWindow(ctk.CTkToplevel):
         self.on_save = on_save
         self.on_language_change = on_language_change
         self._initial_language = get_language()
+        self._initial_language_setting = self.settings.language
+        self._initial_settings = asdict(self.settings)  # For skipping no-op saves
+        self._initial_auto_start: Optional[bool] = None  # Read after the UI is built
 
-        # Window setup
+        if SettingsWindow._HEADER_FONT is None:
+            SettingsWindow._HEADER_FONT = ctk.CTkFont(size=14, weight="bold")
+            SettingsWindow._HELP_FONT = ctk.CTkFont(size=11)
+
+        # Slider value label updates waiting for the next flush
+        self._pending_labels = {}
+        self._label_after_id: Optional[str] = None
+
+        # Window setup (size and position are set together once the UI is built)
         self.title(t('settings_title'))
-        self.geometry("450x680")
         self.minsize(400, 600)
 
         # Set window icon
         if APP_ICON_PATH.exists():
             self.after(200, lambda: self.iconbitmap(str(APP_ICON_PATH)))
 
-        # Make modal
+        # Keep the window unmapped while it is built, so the widgets are
+        # laid out once when it is shown instead of redrawn row by row
+        self.withdraw()
         self.transient(parent)
-        self.grab_set()
 
         # Build UI
         self._create_ui()
 
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        # Center on parent using the known window size, so no forced
+        # update_idletasks() layout pass is needed to measure the new window
+        scaling = ctk.ScalingTracker.get_window_scaling(self)
+        parent_w, parent_h, parent_x, parent_y = map(
+            int, re.match(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)", parent.winfo_geometry()).groups()
+        )  # One Tcl query instead of four winfo_* calls
+        x = parent_x + (parent_w - round(self.WIDTH * scaling)) // 2
+        y = parent_y + (parent_h - round(self.HEIGHT * scaling)) // 2
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+        self.deiconify()
+
+        # Make modal (the window must be viewable for a grab)
+        self.grab_set()
 
     def _create_ui(self) -> None:
         """Create settings UI."""
@@ -60,94 +103,41 @@ class SettingsWindow(ctk.CTkToplevel):
         self._create_section_header(main_frame, t('settings_detection'), 0)
 
         # Sensitivity slider
-        sensitivity_frame = ctk.CTkFrame(main_frame)
-        sensitivity_frame.grid(row=1, column=0, sticky="ew", pady=5)
-        sensitivity_frame.grid_columnconfigure(1, weight=1)
-
-        ctk.CTkLabel(sensitivity_frame, text=t('settings_sensitivity')).grid(row=0, column=0, padx=10, pady=5)
-        self.sensitivity_slider = ctk.CTkSlider(
-            sensitivity_frame,
-            from_=0.05,
-            to=0.5,
-            number_of_steps=45
+        self.sensitivity_slider, self.sensitivity_var, self.sensitivity_label = self._create_slider_row(
+            main_frame, 1, t('settings_sensitivity'), 0.05, 0.5, 45,
+            self.settings.sensitivity, self._FMT_SENSITIVITY(self.settings.sensitivity),
+            self._update_sensitivity_label
         )
-        self.sensitivity_slider.set(self.settings.sensitivity)
-        self.sensitivity_slider.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.sensitivity_label = ctk.CTkLabel(sensitivity_frame, text=f"{self.settings.sensitivity:.2f}")
-        self.sensitivity_label.grid(row=0, column=2, padx=10, pady=5)
-        self.sensitivity_slider.configure(command=self._update_sensitivity_label)
 
         # Trigger time slider
-        trigger_frame = ctk.CTkFrame(main_frame)
-        trigger_frame.grid(row=2, column=0, sticky="ew", pady=5)
-        trigger_frame.grid_columnconfigure(1, weight=1)
-
-        ctk.CTkLabel(trigger_frame, text=t('settings_trigger_time')).grid(row=0, column=0, padx=10, pady=5)
-        self.trigger_slider = ctk.CTkSlider(
-            trigger_frame,
-            from_=1,
-            to=10,
-            number_of_steps=18
+        self.trigger_slider, self.trigger_var, self.trigger_label = self._create_slider_row(
+            main_frame, 2, t('settings_trigger_time'), 1, 10, 18,
+            self.settings.trigger_time, self._FMT_TRIGGER(self.settings.trigger_time),
+            self._update_trigger_label
         )
-        self.trigger_slider.set(self.settings.trigger_time)
-        self.trigger_slider.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.trigger_label = ctk.CTkLabel(trigger_frame, text=f"{self.settings.trigger_time:.1f}")
-        self.trigger_label.grid(row=0, column=2, padx=10, pady=5)
-        self.trigger_slider.configure(command=self._update_trigger_label)
 
         # Cooldown time slider
-        cooldown_frame = ctk.CTkFrame(main_frame)
-        cooldown_frame.grid(row=3, column=0, sticky="ew", pady=5)
-        cooldown_frame.grid_columnconfigure(1, weight=1)
-
-        ctk.CTkLabel(cooldown_frame, text=t('settings_cooldown_time')).grid(row=0, column=0, padx=10, pady=5)
-        self.cooldown_slider = ctk.CTkSlider(
-            cooldown_frame,
-            from_=5,
-            to=30,
-            number_of_steps=25
+        self.cooldown_slider, self.cooldown_var, self.cooldown_label = self._create_slider_row(
+            main_frame, 3, t('settings_cooldown_time'), 5, 30, 25,
+            self.settings.cooldown_time, self._FMT_COOLDOWN(self.settings.cooldown_time),
+            self._update_cooldown_label
         )
-        self.cooldown_slider.set(self.settings.cooldown_time)
-        self.cooldown_slider.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.cooldown_label = ctk.CTkLabel(cooldown_frame, text=f"{self.settings.cooldown_time:.0f}")
-        self.cooldown_label.grid(row=0, column=2, padx=10, pady=5)
-        self.cooldown_slider.configure(command=self._update_cooldown_label)
 
         # Alert Settings Section
         self._create_section_header(main_frame, t('settings_alerts'), 4)
 
-        # Sound enabled
-        self.sound_var = ctk.BooleanVar(value=self.settings.sound_enabled)
-        sound_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_sound'),
-            variable=self.sound_var
-        )
-        sound_check.grid(row=5, column=0, sticky="w", padx=10, pady=5)
-
-        # Popup enabled
-        self.popup_var = ctk.BooleanVar(value=self.settings.popup_enabled)
-        popup_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_popup'),
-            variable=self.popup_var
-        )
-        popup_check.grid(row=6, column=0, sticky="w", padx=10, pady=5)
-
-        # Fullscreen alert
-        self.fullscreen_alert_var = ctk.BooleanVar(value=self.settings.fullscreen_alert)
-        fullscreen_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_fullscreen_alert'),
-            variable=self.fullscreen_alert_var
-        )
-        fullscreen_check.grid(row=7, column=0, sticky="w", padx=10, pady=5)
+        # Sound, popup and fullscreen alert
+        self._create_checkboxes(main_frame, (
+            ('sound_var', 'settings_sound', self.settings.sound_enabled, 5),
+            ('popup_var', 'settings_popup', self.settings.popup_enabled, 6),
+            ('fullscreen_alert_var', 'settings_fullscreen_alert', self.settings.fullscreen_alert, 7),
+        ))
 
         # Fullscreen alert help text
         fullscreen_help = ctk.CTkLabel(
             main_frame,
             text=t('settings_fullscreen_alert_help'),
-            font=ctk.CTkFont(size=11),
+            font=self._HELP_FONT,
             text_color="gray"
         )
         fullscreen_help.grid(row=8, column=0, sticky="w", padx=25)
@@ -155,85 +145,78 @@ class SettingsWindow(ctk.CTkToplevel):
         # App Settings Section
         self._create_section_header(main_frame, t('settings_app'), 9)
 
-        # Auto start with Windows
-        self.auto_start_var = ctk.BooleanVar(value=StartupManager.is_registered())
-        auto_start_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_autostart'),
-            variable=self.auto_start_var
-        )
-        auto_start_check.grid(row=10, column=0, sticky="w", padx=10, pady=5)
-
-        # Start minimized
-        self.start_minimized_var = ctk.BooleanVar(value=self.settings.start_minimized)
-        start_min_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_start_minimized'),
-            variable=self.start_minimized_var
-        )
-        start_min_check.grid(row=11, column=0, sticky="w", padx=10, pady=5)
-
-        # Auto start detection
-        self.auto_start_detection_var = ctk.BooleanVar(value=self.settings.auto_start_detection)
-        auto_start_detection_check = ctk.CTkCheckBox(
-            main_frame,
-            text=t('settings_auto_start_detection'),
-            variable=self.auto_start_detection_var
-        )
-        auto_start_detection_check.grid(row=12, column=0, sticky="w", padx=10, pady=5)
+        # Auto start with Windows, start minimized, auto start detection
+        # The registry is read once the window is idle, not during construction
+        self._create_checkboxes(main_frame, (
+            ('auto_start_var', 'settings_autostart', False, 10),
+            ('start_minimized_var', 'settings_start_minimized', self.settings.start_minimized, 11),
+            ('auto_start_detection_var', 'settings_auto_start_detection',
+             self.settings.auto_start_detection, 12),
+        ))
+        self.after_idle(self._load_auto_start_state)
 
         # Frame skip
-        frameskip_frame = ctk.CTkFrame(main_frame)
-        frameskip_frame.grid(row=13, column=0, sticky="ew", pady=5)
-        frameskip_frame.grid_columnconfigure(1, weight=1)
-
-        ctk.CTkLabel(frameskip_frame, text=t('settings_frame_skip')).grid(row=0, column=0, padx=10, pady=5)
-        self.frameskip_slider = ctk.CTkSlider(
-            frameskip_frame,
-            from_=1,
-            to=5,
-            number_of_steps=4
+        self.frameskip_slider, self.frameskip_var, self.frameskip_label = self._create_slider_row(
+            main_frame, 13, t('settings_frame_skip'), 1, 5, 4,
+            self.settings.frame_skip, self._FMT_FRAMESKIP(self.settings.frame_skip),
+            self._update_frameskip_label
         )
-        self.frameskip_slider.set(self.settings.frame_skip)
-        self.frameskip_slider.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.frameskip_label = ctk.CTkLabel(frameskip_frame, text=f"{self.settings.frame_skip}")
-        self.frameskip_label.grid(row=0, column=2, padx=10, pady=5)
-        self.frameskip_slider.configure(command=self._update_frameskip_label)
 
         # Help text
         help_text = ctk.CTkLabel(
             main_frame,
             text=t('settings_frame_skip_help'),
-            font=ctk.CTkFont(size=11),
+            font=self._HELP_FONT,
             text_color="gray"
         )
         help_text.grid(row=14, column=0, sticky="w", padx=10)
 
+        # Lightweight detection model and low-power preview scaling
+        self._create_checkboxes(main_frame, (
+            ('lite_model_var', 'settings_lite_model', self.settings.model_complexity == 0, 15),
+            ('low_power_preview_var', 'settings_low_power_preview', self.settings.low_power_preview, 17),
+        ))
+
+        # Help texts
+        lite_model_help = ctk.CTkLabel(
+            main_frame,
+            text=t('settings_lite_model_help'),
+            font=self._HELP_FONT,
+            text_color="gray"
+        )
+        lite_model_help.grid(row=16, column=0, sticky="w", padx=25)
+
+        low_power_preview_help = ctk.CTkLabel(
+            main_frame,
+            text=t('settings_low_power_preview_help'),
+            font=self._HELP_FONT,
+            text_color="gray"
+        )
+        low_power_preview_help.grid(row=18, column=0, sticky="w", padx=25)
+
         # Language Settings Section
-        self._create_section_header(main_frame, t('settings_language'), 15)
+        self._create_section_header(main_frame, t('settings_language'), 19)
 
         # Language selector
         lang_frame = ctk.CTkFrame(main_frame)
-        lang_frame.grid(row=16, column=0, sticky="ew", pady=5)
+        lang_frame.grid(row=20, column=0, sticky="ew", pady=5)
         lang_frame.grid_columnconfigure(1, weight=1)
 
         ctk.CTkLabel(lang_frame, text=t('settings_language_label')).grid(row=0, column=0, padx=10, pady=5)
 
         # Build language options: Auto + all supported languages
-        self._lang_options = [t('settings_language_auto')]
-        self._lang_codes = ['']  # Empty string means auto-detect
-        for code, name in SUPPORTED_LANGUAGES.items():
-            self._lang_options.append(name)
-            self._lang_codes.append(code)
+        self._lang_options = [t('settings_language_auto'), *LANGUAGE_NAMES]
+        self._lang_codes = LANGUAGE_CODES  # Empty string means auto-detect
+        self._lang_name_to_code = dict(zip(self._lang_options, self._lang_codes))
 
         # Get current selection
         current_lang = self.settings.language
         if current_lang and current_lang in SUPPORTED_LANGUAGES:
-            current_index = self._lang_codes.index(current_lang)
+            current_name = SUPPORTED_LANGUAGES[current_lang]
         else:
-            current_index = 0  # Auto
+            current_name = self._lang_options[0]  # Auto
 
-        self.language_var = ctk.StringVar(value=self._lang_options[current_index])
+        self.language_var = ctk.StringVar(value=current_name)
         self.language_dropdown = ctk.CTkOptionMenu(
             lang_frame,
             variable=self.language_var,
@@ -271,35 +254,110 @@ class SettingsWindow(ctk.CTkToplevel):
         )
         save_btn.grid(row=0, column=2, padx=5, sticky="ew")
 
+    def _create_checkboxes(self, parent: ctk.CTkFrame,
+                           specs: Tuple[Tuple[str, str, bool, int], ...]) -> None:
+        """Create checkboxes from (variable attribute, text key, value, row) specs."""
+        for var_name, text_key, value, row in specs:
+            var = ctk.BooleanVar(value=value)
+            setattr(self, var_name, var)
+            ctk.CTkCheckBox(parent, text=t(text_key), variable=var).grid(
+                row=row, column=0, sticky="w", padx=10, pady=5
+            )
+
+    def _create_slider_row(self, parent: ctk.CTkFrame, row: int, label_text: str,
+                           from_: float, to: float, steps: int, value: float, value_text: str,
+                           command: Callable[[float], None]
+                           ) -> Tuple[ctk.CTkSlider, ctk.StringVar, ctk.CTkLabel]:
+        """Create a labeled slider row with a value label.
+
+        Returns:
+            Tuple of (slider, value variable, value label).
+        """
+        frame = ctk.CTkFrame(parent)
+        frame.grid(row=row, column=0, sticky="ew", pady=5)
+        frame.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(frame, text=label_text).grid(row=0, column=0, padx=10, pady=5)
+        slider = ctk.CTkSlider(frame, from_=from_, to=to, number_of_steps=steps)
+        slider.set(value)
+        slider.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
+
+        value_var = ctk.StringVar(value=value_text)
+        value_label = ctk.CTkLabel(frame, textvariable=value_var)
+        value_label.grid(row=0, column=2, padx=10, pady=5)
+
+        slider.configure(command=command)
+        slider.bind("<ButtonRelease-1>", self._flush_value_labels, add="+")
+        return slider, value_var, value_label
+
+    def _load_auto_start_state(self) -> None:
+        """Reflect the current Windows startup registration in the checkbox."""
+        # Read the registry fresh: the Run entry may have been changed outside the app
+        StartupManager.invalidate_cache()
+        self._initial_auto_start = StartupManager.is_registered()
+        self.auto_start_var.set(self._initial_auto_start)
+
     def _create_section_header(self, parent: ctk.CTkFrame, text: str, row: int) -> None:
         """Create a section header."""
         label = ctk.CTkLabel(
             parent,
             text=text,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._HEADER_FONT
         )
         label.grid(row=row, column=0, sticky="w", padx=5, pady=(15, 5))
 
+    def _set_value_label(self, var: ctk.StringVar, text: str) -> None:
+        """Queue a slider value label update.
+
+        Sliders call their command on every mouse motion while dragging, so
+        updates are collected and applied together at most every
+        SLIDER_LABEL_DELAY_MS, always with the latest value. Releasing the
+        slider applies them immediately.
+        """
+        self._pending_labels[var] = text
+        if self._label_after_id is None:
+            self._label_after_id = self.after(self.SLIDER_LABEL_DELAY_MS, self._flush_value_labels)
+
+    def _flush_value_labels(self, event=None) -> None:
+        """Apply queued slider value labels, skipping unchanged ones.
+
+        The labels display a StringVar, so setting it updates the Tk label
+        directly instead of going through CTkLabel.configure.
+        """
+        if self._label_after_id is not None:
+            self.after_cancel(self._label_after_id)
+            self._label_after_id = None
+        pending, self._pending_labels = self._pending_labels, {}
+        for var, text in pending.items():
+            if var.get() != text:
+                var.set(text)
+
+    def destroy(self) -> None:
+        """Cancel a pending label update before destroying the window."""
+        if self._label_after_id is not None:
+            self.after_cancel(self._label_after_id)
+            self._label_after_id = None
+        super().destroy()
+
     def _update_sensitivity_label(self, value: float) -> None:
         """Update sensitivity label."""
-        self.sensitivity_label.configure(text=f"{value:.2f}")
+        self._set_value_label(self.sensitivity_var, self._FMT_SENSITIVITY(value))
 
     def _update_trigger_label(self, value: float) -> None:
         """Update trigger time label."""
-        self.trigger_label.configure(text=f"{value:.1f}")
+        self._set_value_label(self.trigger_var, self._FMT_TRIGGER(value))
 
     def _update_cooldown_label(self, value: float) -> None:
         """Update cooldown time label."""
-        self.cooldown_label.configure(text=f"{value:.0f}")
+        self._set_value_label(self.cooldown_var, self._FMT_COOLDOWN(value))
 
     def _update_frameskip_label(self, value: float) -> None:
         """Update frame skip label."""
-        self.frameskip_label.configure(text=f"{int(value)}")
+        self._set_value_label(self.frameskip_var, self._FMT_FRAMESKIP(value))
 
     def _reset_settings(self) -> None:
         """Reset settings to defaults."""
-        from utils.config import AppConfig
-        defaults = AppConfig()
+        defaults = DEFAULT_SETTINGS
 
         self.sensitivity_slider.set(defaults.sensitivity)
         self.trigger_slider.set(defaults.trigger_time)
@@ -311,6 +369,8 @@ class SettingsWindow(ctk.CTkToplevel):
         self.start_minimized_var.set(defaults.start_minimized)
         self.auto_start_detection_var.set(defaults.auto_start_detection)
         self.frameskip_slider.set(defaults.frame_skip)
+        self.lite_model_var.set(defaults.model_complexity == 0)
+        self.low_power_preview_var.set(defaults.low_power_preview)
         self.language_var.set(self._lang_options[0])  # Auto
 
         # Update labels
@@ -332,11 +392,11 @@ class SettingsWindow(ctk.CTkToplevel):
         self.settings.start_minimized = self.start_minimized_var.get()
         self.settings.auto_start_detection = self.auto_start_detection_var.get()
         self.settings.frame_skip = int(self.frameskip_slider.get())
+        self.settings.model_complexity = 0 if self.lite_model_var.get() else 1
+        self.settings.low_power_preview = self.low_power_preview_var.get()
 
         # Update language setting
-        selected_lang_name = self.language_var.get()
-        selected_index = self._lang_options.index(selected_lang_name)
-        selected_lang_code = self._lang_codes[selected_index]
+        selected_lang_code = self._lang_name_to_code[self.language_var.get()]
         self.settings.language = selected_lang_code
 
         # Apply language change
@@ -346,18 +406,19 @@ class SettingsWindow(ctk.CTkToplevel):
             if get_language() != selected_lang_code:
                 set_language(selected_lang_code)
                 language_changed = True
-        else:
-            # Auto-detect language
-            from utils.i18n import init_language
+        elif self._initial_language_setting:
+            # Switched to auto-detect: detect the system language
             new_lang = init_language(None)
             if new_lang != self._initial_language:
                 language_changed = True
 
-        # Update Windows startup registration
-        StartupManager.set_startup(self.settings.auto_start)
+        # Update Windows startup registration (registry write) only if toggled
+        if self.settings.auto_start != self._initial_auto_start:
+            StartupManager.set_startup(self.settings.auto_start)
 
-        # Save to file
-        self.config.save()
+        # Save to file, unless nothing was actually changed
+        if asdict(self.settings) != self._initial_settings:
+            self.config.save()
 
         # Callback for settings update
         if self.on_save:
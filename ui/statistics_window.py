@@ -2,15 +2,123 @@
 import customtkinter as ctk
 from datetime import datetime, timedelta
 import calendar
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Callable
+from tkinter import TclError
+from typing import Optional, Dict, Callable, Tuple
 
-from utils.statistics import StatisticsManager, DailyStats
+from utils.statistics import StatisticsManager, DailyStats, SummaryBundle, MonthlyCalendar, HourlyPattern
 from utils.i18n import t
 
 # Path to the app icon
 APP_ICON_PATH = Path(__file__).parent.parent / "assets" / "icon.ico"
 
+# Calendar cell colors for days without touches
+NO_TOUCH_BG_COLOR = "#1e3a2f"  # Subtle green
+NO_TOUCH_TEXT_COLOR = "#6fcf97"
+
+
+def _intensity_color(intensity: float) -> str:
+    """Cell color for a touch intensity (0-1): yellow -> orange -> red."""
+    if intensity < 0.5:
+        # Yellow to orange
+        r = int(255)
+        g = int(200 - 100 * intensity)
+        b = int(50)
+    else:
+        # Orange to red
+        r = int(255 - 50 * (intensity - 0.5))
+        g = int(100 - 100 * (intensity - 0.5))
+        b = int(50)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# Precomputed intensity colors, indexed by int(intensity * 255)
+COLOR_RAMP = tuple(_intensity_color(i / 255) for i in range(256))
+
+# Sunday-first calendar used for the month grid
+_CAL_SUN = calendar.Calendar(firstweekday=6)
+
+
+@lru_cache(maxsize=128)
+def _month_days(year: int, month: int) -> Tuple[int, ...]:
+    """Day numbers of a month's grid cells, week by week (0 = outside the month)."""
+    return tuple(day for week in _CAL_SUN.monthdayscalendar(year, month) for day in week)
+
+
+# Month and weekday names in the current language (filled by refresh_i18n_cache)
+_MONTH_NAMES: Tuple[str, ...] = ()
+_DAY_NAMES_SUN_START: Tuple[str, ...] = ()
+_WEEKDAYS_MON_START: Tuple[str, ...] = ()
+
+
+# Fonts shared by every widget in the window, created on first use
+# (a CTkFont needs a Tk root to exist)
+_FONTS: Dict[Tuple[int, str], ctk.CTkFont] = {}
+
+
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get the shared CTkFont for a size and weight."""
+    key = (size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+# Worker threads for database queries, created on first use
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _run_async(widget, fn: Callable, *args, callback: Callable,
+               on_error: Optional[Callable[[Exception], None]] = None) -> None:
+    """Run fn(*args) on a worker thread and pass the result to callback on the Tk thread.
+
+    If fn raises, on_error (if given) gets the exception on the Tk thread instead.
+    Neither is called if the widget has been destroyed in the meantime.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stats")
+
+    def deliver(handler: Callable, value) -> None:
+        try:
+            if widget.winfo_exists():
+                handler(value)
+        except TclError:
+            pass  # Window closed
+
+    def on_done(future) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Failed to load statistics: {e}")
+            if on_error is None:
+                return
+            handler, value = on_error, e
+        else:
+            handler, value = callback, result
+        try:
+            widget.after(0, lambda: deliver(handler, value))
+        except (RuntimeError, TclError):
+            pass  # Main loop is gone
+
+    _EXECUTOR.submit(fn, *args).add_done_callback(on_done)
+
+
+def refresh_i18n_cache() -> None:
+    """Translate month and weekday names once for the current language."""
+    global _MONTH_NAMES, _DAY_NAMES_SUN_START, _WEEKDAYS_MON_START
+    _MONTH_NAMES = tuple(t(f'month_{i}') for i in range(1, 13))
+    _DAY_NAMES_SUN_START = (
+        t('day_sun'), t('day_mon'), t('day_tue'), t('day_wed'),
+        t('day_thu'), t('day_fri'), t('day_sat')
+    )
+    # Monday first, matching datetime.weekday()
+    _WEEKDAYS_MON_START = _DAY_NAMES_SUN_START[1:] + _DAY_NAMES_SUN_START[:1]
+
 
 class SummaryCard(ctk.CTkFrame):
     """Modern summary card widget."""
@@ -29,14 +137,14 @@ class SummaryCard(ctk.CTkFrame):
             icon_label = ctk.CTkLabel(
                 value_frame,
                 text=icon,
-                font=ctk.CTkFont(size=24)
+                font=_font(24)
             )
             icon_label.pack(side="left", padx=(0, 8))
 
         self.value_label = ctk.CTkLabel(
             value_frame,
             text=value,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color=color
         )
         self.value_label.pack(side="left")
@@ -45,7 +153,7 @@ class SummaryCard(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self,
             text=title,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         self.title_label.pack(pady=(0, 15))
@@ -58,6 +166,14 @@ class SummaryCard(ctk.CTkFrame):
 class CalendarWidget(ctk.CTkFrame):
     """Calendar widget showing monthly touch statistics."""
 
+    PREFETCH_DELAY_MS = 100  # Idle delay before loading the adjacent months
+
+    # Cell geometry (unscaled pixels)
+    CELL_SIZE = 44
+    CELL_GAP = 2
+    CELL_RADIUS = 8
+    HEADER_HEIGHT = 36
+
     def __init__(self, parent: ctk.CTkFrame, stats_manager: StatisticsManager,
                  on_date_select: Optional[Callable[[str], None]] = None):
         super().__init__(parent, corner_radius=12)
@@ -71,9 +187,22 @@ class CalendarWidget(ctk.CTkFrame):
         self.current_month = now.month
         self.selected_date: Optional[str] = None
 
+        # Touch counts per (year, month), so navigating back and forth
+        # doesn't query the database again
+        self._month_cache: Dict[Tuple[int, int], MonthlyCalendar] = {}
+        self._loading_months: set = set()  # Months being queried on a worker thread
+        self._prefetch_id = None
+
         self.grid_columnconfigure(0, weight=1)
         self._create_ui()
 
+    def destroy(self) -> None:
+        """Cancel a pending prefetch before destroying the widget."""
+        if self._prefetch_id is not None:
+            self.after_cancel(self._prefetch_id)
+            self._prefetch_id = None
+        super().destroy()
+
     def _create_ui(self) -> None:
         """Create calendar UI."""
         # Navigation header
@@ -95,7 +224,7 @@ class CalendarWidget(ctk.CTkFrame):
         self.month_label = ctk.CTkLabel(
             nav_frame,
             text="",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         self.month_label.pack(side="left", expand=True)
 
@@ -111,36 +240,29 @@ class CalendarWidget(ctk.CTkFrame):
         )
         self.next_btn.pack(side="right")
 
-        # Calendar grid container
-        self.calendar_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.calendar_frame.pack(fill="both", expand=True, padx=10, pady=(0, 15))
-
-        # Configure grid columns
-        for i in range(7):
-            self.calendar_frame.grid_columnconfigure(i, weight=1)
-
-        self._render_calendar()
-
-    def _render_calendar(self) -> None:
-        """Render the calendar for current month."""
-        # Clear existing widgets
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        # Calendar grid: one canvas with pre-created items for the day
+        # headers and 42 cells (6 weeks x 7 days), reconfigured per month
+        self._cell_size = self._apply_widget_scaling(self.CELL_SIZE)
+        self._cell_gap = self._apply_widget_scaling(self.CELL_GAP)
+        self._header_height = self._apply_widget_scaling(self.HEADER_HEIGHT)
+        self.calendar_canvas = tk.Canvas(
+            self,
+            height=self._header_height + 6 * (self._cell_size + self._cell_gap),
+            width=7 * (self._cell_size + self._cell_gap),
+            bg=self._apply_appearance_mode(self.cget("fg_color")),
+            highlightthickness=0
+        )
+        self.calendar_canvas.pack(fill="x", padx=10, pady=(0, 15))
 
-        # Update month label
-        month_names = [
-            t('month_1'), t('month_2'), t('month_3'), t('month_4'),
-            t('month_5'), t('month_6'), t('month_7'), t('month_8'),
-            t('month_9'), t('month_10'), t('month_11'), t('month_12')
-        ]
-        self.month_label.configure(text=f"{self.current_year} {month_names[self.current_month - 1]}")
+        # Shared fonts for all cells (scaled tuples, as canvas items aren't CTk widgets)
+        self._day_font = self._apply_font_scaling(_font(13))
+        self._day_font_bold = self._apply_font_scaling(_font(13, "bold"))
+        self._count_font = self._apply_font_scaling(_font(9))
+        header_font = self._apply_font_scaling(_font(11, "bold"))
 
         # Day headers
-        day_names = [
-            t('day_sun'), t('day_mon'), t('day_tue'), t('day_wed'),
-            t('day_thu'), t('day_fri'), t('day_sat')
-        ]
-        for i, day in enumerate(day_names):
+        self._header_items = []
+        for i, day in enumerate(_DAY_NAMES_SUN_START):
             # Sunday in red, Saturday in blue
             if i == 0:
                 text_color = "#ff6b6b"
@@ -148,104 +270,173 @@ class CalendarWidget(ctk.CTkFrame):
                 text_color = "#74b9ff"
             else:
                 text_color = "gray"
-
-            label = ctk.CTkLabel(
-                self.calendar_frame,
-                text=day,
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color=text_color
+            self._header_items.append(self.calendar_canvas.create_text(
+                0, 0, text=day, font=header_font, fill=text_color
+            ))
+
+        # Day cells: (background, day number, touch count) item ids
+        self._cells = []
+        self._cell_dates: list = [None] * 42
+        self._cell_index: Dict[int, int] = {}  # Item id -> cell index
+        for index in range(42):
+            items = (
+                self.calendar_canvas.create_polygon(
+                    0, 0, 0, 0, smooth=True, outline="#3b8ed0",  # Outline only drawn for today
+                    width=0, state="hidden", tags="cell"
+                ),
+                self.calendar_canvas.create_text(
+                    0, 0, font=self._day_font, state="hidden", tags="cell"
+                ),
+                self.calendar_canvas.create_text(
+                    0, 0, font=self._count_font, state="hidden", tags="cell"
+                )
             )
-            label.grid(row=0, column=i, pady=(0, 8), sticky="ew")
+            self._cells.append(items)
+            for item in items:
+                self._cell_index[item] = index
+
+        # One click binding for every cell item
+        self.calendar_canvas.tag_bind("cell", "<Button-1>", self._on_cell_click)
+        self.calendar_canvas.bind("<Configure>", self._layout_cells)
+
+        self._render_calendar()
+
+    @staticmethod
+    def _rounded_rect(x0: float, y0: float, x1: float, y1: float, r: float) -> Tuple[float, ...]:
+        """Polygon points that draw a rounded rectangle with smooth=True."""
+        return (
+            x0 + r, y0, x0 + r, y0, x1 - r, y0, x1 - r, y0,
+            x1, y0, x1, y0 + r, x1, y0 + r, x1, y1 - r, x1, y1 - r,
+            x1, y1, x1 - r, y1, x1 - r, y1, x0 + r, y1, x0 + r, y1,
+            x0, y1, x0, y1 - r, x0, y1 - r, x0, y0 + r, x0, y0 + r, x0, y0
+        )
+
+    def _layout_cells(self, event=None) -> None:
+        """Position headers and cells to spread across the canvas width."""
+        canvas = self.calendar_canvas
+        column_width = canvas.winfo_width() / 7
+        size = self._cell_size
+        radius = self._apply_widget_scaling(self.CELL_RADIUS)
+
+        for i, item in enumerate(self._header_items):
+            canvas.coords(item, (i + 0.5) * column_width, self._header_height / 2)
+
+        for index, (rect, day_text, count_text) in enumerate(self._cells):
+            week_num, day_num = divmod(index, 7)
+            x0 = (day_num + 0.5) * column_width - size / 2
+            y0 = self._header_height + week_num * (size + self._cell_gap)
+            canvas.coords(rect, *self._rounded_rect(x0, y0, x0 + size, y0 + size, radius))
+            canvas.coords(day_text, x0 + size / 2, y0 + size * 0.35)
+            canvas.coords(count_text, x0 + size / 2, y0 + size * 0.72)
+
+    def _render_calendar(self) -> None:
+        """Render the calendar for current month."""
+        # Update month label
+        self.month_label.configure(text=f"{self.current_year} {_MONTH_NAMES[self.current_month - 1]}")
 
         # Get touch data for this month
-        touch_data = self.stats_manager.get_monthly_calendar(self.current_year, self.current_month)
+        key = (self.current_year, self.current_month)
+        month_data = self._month_cache.get(key)
+        if month_data is None:
+            # Hide the previous month's cells so they can't be clicked under
+            # the new label; rendered again by _on_month_loaded once the query finishes
+            self._cell_dates = [None] * len(self._cells)
+            self.calendar_canvas.itemconfigure("cell", state="hidden")
+            self._load_month(key)
+            return
+        touch_data = month_data.values
+        max_touches = month_data.max_value  # Already at least 1
 
         # Get calendar for this month (Sunday start)
-        cal = calendar.Calendar(firstweekday=6)  # Sunday start
-        month_days = cal.monthdayscalendar(self.current_year, self.current_month)
-
-        # Find max touches for color scaling
-        max_touches = max(touch_data.values()) if touch_data else 1
-
-        today = datetime.now()
-        today_str = today.strftime("%Y-%m-%d")
-
-        for week_num, week in enumerate(month_days, start=1):
-            for day_num, day in enumerate(week):
-                if day == 0:
-                    # Empty cell
-                    label = ctk.CTkLabel(self.calendar_frame, text="", width=44, height=44)
-                    label.grid(row=week_num, column=day_num, padx=1, pady=1)
-                else:
-                    date_str = f"{self.current_year:04d}-{self.current_month:02d}-{day:02d}"
-                    touches = touch_data.get(day, 0)
-
-                    # Determine background color based on touch count
-                    if touches == 0:
-                        # No touches - subtle green
-                        bg_color = "#1e3a2f"
-                        text_color = "#6fcf97"
-                    else:
-                        # Touches - gradient from yellow to red based on intensity
-                        intensity = min(touches / max(max_touches, 1), 1.0)
-                        if intensity < 0.5:
-                            # Yellow to orange
-                            r = int(255)
-                            g = int(200 - 100 * intensity)
-                            b = int(50)
-                        else:
-                            # Orange to red
-                            r = int(255 - 50 * (intensity - 0.5))
-                            g = int(100 - 100 * (intensity - 0.5))
-                            b = int(50)
-                        bg_color = f"#{r:02x}{g:02x}{b:02x}"
-                        text_color = "white"
-
-                    # Highlight today
-                    if date_str == today_str:
-                        border_color = "#3b8ed0"
-                        border_width = 3
-                    else:
-                        border_color = None
-                        border_width = 0
-
-                    # Create day cell
-                    cell_frame = ctk.CTkFrame(
-                        self.calendar_frame,
-                        fg_color=bg_color,
-                        width=44,
-                        height=44,
-                        corner_radius=8,
-                        border_color=border_color,
-                        border_width=border_width
-                    )
-                    cell_frame.grid(row=week_num, column=day_num, padx=1, pady=1)
-                    cell_frame.grid_propagate(False)
-
-                    # Day number
-                    day_label = ctk.CTkLabel(
-                        cell_frame,
-                        text=str(day),
-                        font=ctk.CTkFont(size=13, weight="bold" if touches > 0 else "normal"),
-                        text_color=text_color
-                    )
-                    day_label.place(relx=0.5, rely=0.35, anchor="center")
-
-                    # Touch count (if any)
-                    if touches > 0:
-                        count_label = ctk.CTkLabel(
-                            cell_frame,
-                            text=str(touches),
-                            font=ctk.CTkFont(size=9),
-                            text_color=text_color
-                        )
-                        count_label.place(relx=0.5, rely=0.72, anchor="center")
-
-                    # Bind click event
-                    cell_frame.bind("<Button-1>", lambda e, d=date_str: self._on_day_click(d))
-                    day_label.bind("<Button-1>", lambda e, d=date_str: self._on_day_click(d))
-                    if touches > 0:
-                        count_label.bind("<Button-1>", lambda e, d=date_str: self._on_day_click(d))
+        month_days = _month_days(self.current_year, self.current_month)
+
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        canvas = self.calendar_canvas
+        today_border = self._apply_widget_scaling(3)
+
+        for index, (rect, day_text, count_text) in enumerate(self._cells):
+            day = month_days[index] if index < len(month_days) else 0
+            if day == 0:
+                # Empty cell (or week not in this month)
+                self._cell_dates[index] = None
+                for item in (rect, day_text, count_text):
+                    canvas.itemconfigure(item, state="hidden")
+                continue
+
+            date_str = f"{self.current_year:04d}-{self.current_month:02d}-{day:02d}"
+            self._cell_dates[index] = date_str
+            touches = touch_data.get(day, 0)
+
+            # Determine background color based on touch count
+            if touches == 0:
+                bg_color = NO_TOUCH_BG_COLOR
+                text_color = NO_TOUCH_TEXT_COLOR
+            else:
+                # Touches - gradient from yellow to red based on intensity
+                bg_color = COLOR_RAMP[min(touches * 255 // max_touches, 255)]
+                text_color = "white"
+
+            # Highlight today
+            border_width = today_border if date_str == today_str else 0
+
+            canvas.itemconfigure(rect, fill=bg_color, width=border_width, state="normal")
+
+            # Day number
+            canvas.itemconfigure(
+                day_text,
+                text=str(day),
+                font=self._day_font_bold if touches > 0 else self._day_font,
+                fill=text_color,
+                state="normal"
+            )
+
+            # Touch count (if any)
+            if touches > 0:
+                canvas.itemconfigure(count_text, text=str(touches), fill=text_color, state="normal")
+            else:
+                canvas.itemconfigure(count_text, state="hidden")
+
+        # Load the neighbouring months while the user looks at this one;
+        # a newer render supersedes a pending prefetch
+        if self._prefetch_id is not None:
+            self.after_cancel(self._prefetch_id)
+        self._prefetch_id = self.after(self.PREFETCH_DELAY_MS, self._prefetch_adjacent)
+
+    def _load_month(self, key: Tuple[int, int]) -> None:
+        """Query a month's touch counts on a worker thread."""
+        if key in self._loading_months:
+            return
+        self._loading_months.add(key)
+        _run_async(self, self.stats_manager.get_monthly_calendar, *key,
+                   callback=lambda data: self._on_month_loaded(key, data),
+                   on_error=lambda e: self._loading_months.discard(key))
+
+    def _on_month_loaded(self, key: Tuple[int, int], data: MonthlyCalendar) -> None:
+        """Cache a queried month and render it if it is still displayed."""
+        self._loading_months.discard(key)
+        self._month_cache[key] = data
+        if key == (self.current_year, self.current_month):
+            self._render_calendar()
+
+    def _prefetch_adjacent(self) -> None:
+        """Cache touch counts for the months before and after the current one."""
+        self._prefetch_id = None
+        year, month = self.current_year, self.current_month
+        prev_key = (year - 1, 12) if month == 1 else (year, month - 1)
+        next_key = (year + 1, 1) if month == 12 else (year, month + 1)
+        for key in (prev_key, next_key):
+            if key not in self._month_cache:
+                self._load_month(key)
+
+    def _on_cell_click(self, event) -> None:
+        """Handle a click on a day cell's background or text."""
+        current = self.calendar_canvas.find_withtag("current")
+        if not current:
+            return
+
+        date_str = self._cell_dates[self._cell_index[current[0]]]
+        if date_str is not None:
+            self._on_day_click(date_str)
 
     def _on_day_click(self, date_str: str) -> None:
         """Handle day click."""
@@ -271,8 +462,13 @@ class CalendarWidget(ctk.CTkFrame):
             self.current_month += 1
         self._render_calendar()
 
+    def invalidate(self, date_str: str) -> None:
+        """Drop cached touch counts for the month containing date_str (YYYY-MM-DD)."""
+        self._month_cache.pop((int(date_str[:4]), int(date_str[5:7])), None)
+
     def refresh(self) -> None:
         """Refresh the calendar display."""
+        self._month_cache.pop((self.current_year, self.current_month), None)
         self._render_calendar()
 
 
@@ -283,6 +479,8 @@ class HourlyChartWidget(ctk.CTkFrame):
         super().__init__(parent, corner_radius=12)
 
         self.stats_manager = stats_manager
+        # (end date, pattern) of the last 7-day hourly pattern query
+        self._pattern_cache: Optional[Tuple[str, HourlyPattern]] = None
         self.grid_columnconfigure(0, weight=1)
         self._create_ui()
 
@@ -292,7 +490,7 @@ class HourlyChartWidget(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text=t('stats_hourly_pattern'),
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             text_color="gray"
         )
         title.pack(anchor="w", padx=15, pady=(15, 10))
@@ -305,19 +503,26 @@ class HourlyChartWidget(ctk.CTkFrame):
 
     def _render_chart(self) -> None:
         """Render the hourly chart."""
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        if self._pattern_cache is None or self._pattern_cache[0] != today_str:
+            # Rendered again by _on_pattern_loaded once the query finishes
+            _run_async(self, self.stats_manager.get_hourly_pattern, 7,
+                       callback=lambda pattern: self._on_pattern_loaded(today_str, pattern))
+            return
+        pattern = self._pattern_cache[1]
+
         # Clear existing
         for widget in self.chart_frame.winfo_children():
             widget.destroy()
-
-        hourly_data = self.stats_manager.get_hourly_pattern(days=7)
-        max_count = max(hourly_data.values()) if hourly_data else 1
+        hourly_data = pattern.values
+        max_count = pattern.max_value  # Already at least 1
 
         # Create bars for each hour
         for hour in range(24):
             self.chart_frame.grid_columnconfigure(hour, weight=1)
 
             count = hourly_data.get(hour, 0)
-            height_pct = (count / max_count * 100) if max_count > 0 else 0
+            height_pct = count / max_count * 100
 
             # Bar container
             bar_container = ctk.CTkFrame(self.chart_frame, fg_color="transparent", height=70)
@@ -348,13 +553,23 @@ class HourlyChartWidget(ctk.CTkFrame):
                 hour_label = ctk.CTkLabel(
                     self.chart_frame,
                     text=f"{hour}",
-                    font=ctk.CTkFont(size=10),
+                    font=_font(10),
                     text_color="gray"
                 )
                 hour_label.grid(row=1, column=hour, sticky="n", pady=(2, 0))
 
+    def _on_pattern_loaded(self, today_str: str, pattern: HourlyPattern) -> None:
+        """Cache a queried hourly pattern and render it."""
+        self._pattern_cache = (today_str, pattern)
+        self._render_chart()
+
+    def invalidate(self) -> None:
+        """Drop the cached hourly pattern (e.g. after a new touch was logged)."""
+        self._pattern_cache = None
+
     def refresh(self) -> None:
         """Refresh the chart."""
+        self._pattern_cache = None
         self._render_chart()
 
 
@@ -365,6 +580,7 @@ class DailyDetailWidget(ctk.CTkFrame):
         super().__init__(parent, corner_radius=12)
 
         self.stats_manager = stats_manager
+        self._requested_date: Optional[str] = None  # Latest date passed to _load_stats
         self.grid_columnconfigure(0, weight=1)
         self._create_ui()
 
@@ -378,7 +594,7 @@ class DailyDetailWidget(ctk.CTkFrame):
         date_icon = ctk.CTkLabel(
             header_frame,
             text="📅",
-            font=ctk.CTkFont(size=20)
+            font=_font(20)
         )
         date_icon.pack(side="left", padx=(0, 10))
 
@@ -386,7 +602,7 @@ class DailyDetailWidget(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             header_frame,
             text=t('stats_today'),
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         self.title_label.pack(side="left")
 
@@ -394,16 +610,49 @@ class DailyDetailWidget(ctk.CTkFrame):
         self.stats_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.stats_frame.pack(fill="x", padx=15, pady=(0, 15))
 
-        self._render_stats(datetime.now().strftime("%Y-%m-%d"))
+        # "No data" message, shown instead of the stat rows
+        self.no_data_frame = ctk.CTkFrame(self.stats_frame, fg_color="transparent")
 
-    def _render_stats(self, date_str: str) -> None:
-        """Render stats for the given date."""
-        # Clear existing
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
+        no_data_icon = ctk.CTkLabel(
+            self.no_data_frame,
+            text="✨",
+            font=_font(32)
+        )
+        no_data_icon.pack()
+
+        no_data_label = ctk.CTkLabel(
+            self.no_data_frame,
+            text=t('stats_no_data'),
+            text_color="gray",
+            font=_font(13)
+        )
+        no_data_label.pack(pady=(5, 0))
+
+        # Stat rows, created once and filled in by _render_stats
+        self.stats_grid = ctk.CTkFrame(self.stats_frame, fg_color="transparent")
+        self.stats_grid.grid_columnconfigure((0, 1), weight=1)
+
+        self._total_row = self._create_stat_row(self.stats_grid, 0, "🖐️", t('stats_total_touches'))
+        self._avg_row = self._create_stat_row(self.stats_grid, 1, "⏱️", t('stats_avg_duration'))
+        self._first_row = self._create_stat_row(self.stats_grid, 2, "🌅", t('stats_first_touch'))
+        self._last_row = self._create_stat_row(self.stats_grid, 3, "🌙", t('stats_last_touch'))
+        self._peak_row = self._create_stat_row(self.stats_grid, 4, "📈", t('stats_peak_hour'))
+
+        self._load_stats(datetime.now().strftime("%Y-%m-%d"))
 
-        stats = self.stats_manager.get_daily_stats(date_str)
+    def _load_stats(self, date_str: str) -> None:
+        """Query stats for the given date on a worker thread, then render them."""
+        self._requested_date = date_str
+        _run_async(self, self.stats_manager.get_daily_stats, date_str,
+                   callback=lambda stats: self._on_stats_loaded(date_str, stats))
 
+    def _on_stats_loaded(self, date_str: str, stats: Optional[DailyStats]) -> None:
+        """Render queried stats unless a newer date was requested meanwhile."""
+        if date_str == self._requested_date:
+            self._render_stats(date_str, stats)
+
+    def _render_stats(self, date_str: str, stats: Optional[DailyStats]) -> None:
+        """Render stats for the given date."""
         # Parse date for display
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
@@ -411,11 +660,7 @@ class DailyDetailWidget(ctk.CTkFrame):
                 date_display = t('stats_today')
             else:
                 # Format with weekday
-                weekdays = [
-                    t('day_mon'), t('day_tue'), t('day_wed'), t('day_thu'),
-                    t('day_fri'), t('day_sat'), t('day_sun')
-                ]
-                weekday = weekdays[date_obj.weekday()]
+                weekday = _WEEKDAYS_MON_START[date_obj.weekday()]
                 date_display = f"{date_obj.month}/{date_obj.day} ({weekday})"
         except ValueError:
             date_display = date_str
@@ -423,63 +668,47 @@ class DailyDetailWidget(ctk.CTkFrame):
         self.title_label.configure(text=date_display)
 
         if stats is None or stats.total_touches == 0:
-            no_data_frame = ctk.CTkFrame(self.stats_frame, fg_color="transparent")
-            no_data_frame.pack(fill="x", pady=20)
-
-            no_data_icon = ctk.CTkLabel(
-                no_data_frame,
-                text="✨",
-                font=ctk.CTkFont(size=32)
-            )
-            no_data_icon.pack()
-
-            no_data_label = ctk.CTkLabel(
-                no_data_frame,
-                text=t('stats_no_data'),
-                text_color="gray",
-                font=ctk.CTkFont(size=13)
-            )
-            no_data_label.pack(pady=(5, 0))
+            self.stats_grid.pack_forget()
+            self.no_data_frame.pack(fill="x", pady=20)
             return
 
-        # Stats in grid
-        stats_grid = ctk.CTkFrame(self.stats_frame, fg_color="transparent")
-        stats_grid.pack(fill="x")
-        stats_grid.grid_columnconfigure((0, 1), weight=1)
+        self.no_data_frame.pack_forget()
+        self.stats_grid.pack(fill="x")
 
         # Total touches
-        self._create_stat_row(stats_grid, 0, "🖐️", t('stats_total_touches'), str(stats.total_touches))
+        self._set_stat_row(self._total_row, str(stats.total_touches))
 
         # Average duration
-        self._create_stat_row(stats_grid, 1, "⏱️", t('stats_avg_duration'), f"{stats.avg_duration:.1f}s")
+        self._set_stat_row(self._avg_row, f"{stats.avg_duration:.1f}s")
 
         # First/Last touch
-        if stats.first_touch:
-            self._create_stat_row(stats_grid, 2, "🌅", t('stats_first_touch'), stats.first_touch)
-        if stats.last_touch:
-            self._create_stat_row(stats_grid, 3, "🌙", t('stats_last_touch'), stats.last_touch)
+        self._set_stat_row(self._first_row, stats.first_touch)
+        self._set_stat_row(self._last_row, stats.last_touch)
 
         # Peak hour
+        peak_text = None
         if stats.hourly_distribution:
             peak_hour = max(stats.hourly_distribution, key=stats.hourly_distribution.get)
             peak_count = stats.hourly_distribution[peak_hour]
-            self._create_stat_row(stats_grid, 4, "📈", t('stats_peak_hour'), f"{peak_hour}:00 ({peak_count})")
+            peak_text = f"{peak_hour}:00 ({peak_count})"
+        self._set_stat_row(self._peak_row, peak_text)
 
-    def _create_stat_row(self, parent: ctk.CTkFrame, row: int, icon: str, label: str, value: str) -> None:
-        """Create a stat display row with icon."""
+    def _create_stat_row(self, parent: ctk.CTkFrame, row: int, icon: str,
+                         label: str) -> Tuple[ctk.CTkFrame, ctk.CTkLabel]:
+        """Create a stat display row with icon; returns (row frame, value label)."""
         row_frame = ctk.CTkFrame(parent, fg_color="#2b2b2b", corner_radius=8, height=40)
         row_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=3)
         row_frame.grid_propagate(False)
 
         # Icon
-        icon_label = ctk.CTkLabel(row_frame, text=icon, font=ctk.CTkFont(size=14))
+        icon_label = ctk.CTkLabel(row_frame, text=icon, font=_font(14))
         icon_label.pack(side="left", padx=(12, 8))
 
         # Label
         label_widget = ctk.CTkLabel(
             row_frame,
             text=label,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray"
         )
         label_widget.pack(side="left")
@@ -487,28 +716,51 @@ class DailyDetailWidget(ctk.CTkFrame):
         # Value
         value_widget = ctk.CTkLabel(
             row_frame,
-            text=value,
-            font=ctk.CTkFont(size=13, weight="bold")
+            text="",
+            font=_font(13, "bold")
         )
         value_widget.pack(side="right", padx=12)
 
+        return row_frame, value_widget
+
+    @staticmethod
+    def _set_stat_row(stat_row: Tuple[ctk.CTkFrame, ctk.CTkLabel], value: Optional[str]) -> None:
+        """Show a stat row with the given value, or hide it if value is empty."""
+        row_frame, value_widget = stat_row
+        if value:
+            value_widget.configure(text=value)
+            row_frame.grid()
+        else:
+            row_frame.grid_remove()
+
     def show_date(self, date_str: str) -> None:
         """Show stats for a specific date."""
-        self._render_stats(date_str)
+        self._load_stats(date_str)
 
     def refresh(self) -> None:
         """Refresh current display."""
-        self._render_stats(datetime.now().strftime("%Y-%m-%d"))
+        self._load_stats(datetime.now().strftime("%Y-%m-%d"))
 
 
 class StatisticsWindow(ctk.CTkToplevel):
     """Statistics and calendar window."""
 
+    DEFERRED_BUILD_MS = 50  # Delay before building the below-the-fold sections
+
     def __init__(self, parent: ctk.CTk, stats_manager: StatisticsManager):
         super().__init__(parent)
 
         self.stats_manager = stats_manager
 
+        # Built after the first paint by _build_deferred_sections
+        self.daily_detail: Optional[DailyDetailWidget] = None
+        self.hourly_chart: Optional[HourlyChartWidget] = None
+        self._pending_date: Optional[str] = None
+        self._deferred_id = None
+
+        # The language may have changed since the window was last opened
+        refresh_i18n_cache()
+
         # Window setup
         self.title(t('stats_title'))
         self.geometry("700x750")
@@ -531,6 +783,16 @@ class StatisticsWindow(ctk.CTkToplevel):
         y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
 
+        # Build the sections below the calendar once the window has painted
+        self._deferred_id = self.after(self.DEFERRED_BUILD_MS, self._build_deferred_sections)
+
+    def destroy(self) -> None:
+        """Cancel the deferred build before destroying the window."""
+        if self._deferred_id is not None:
+            self.after_cancel(self._deferred_id)
+            self._deferred_id = None
+        super().destroy()
+
     def _create_ui(self) -> None:
         """Create statistics UI."""
         self.grid_columnconfigure(0, weight=1)
@@ -540,9 +802,10 @@ class StatisticsWindow(ctk.CTkToplevel):
         main_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
         main_frame.grid(row=0, column=0, sticky="nsew", padx=15, pady=15)
         main_frame.grid_columnconfigure(0, weight=1)
+        self._main_frame = main_frame
 
         # ========== Summary Cards (Top Row) ==========
-        self._create_summary_section(main_frame)
+        self._build_summary_section(main_frame)
 
         # ========== Calendar (Full Width) ==========
         self.calendar = CalendarWidget(
@@ -557,13 +820,8 @@ class StatisticsWindow(ctk.CTkToplevel):
         legend_frame.grid(row=2, column=0, sticky="ew", pady=(10, 0))
         self._create_legend(legend_frame)
 
-        # ========== Daily Detail ==========
-        self.daily_detail = DailyDetailWidget(main_frame, self.stats_manager)
-        self.daily_detail.grid(row=3, column=0, sticky="ew", pady=(15, 0))
-
-        # ========== Hourly Chart ==========
-        self.hourly_chart = HourlyChartWidget(main_frame, self.stats_manager)
-        self.hourly_chart.grid(row=4, column=0, sticky="ew", pady=(15, 0))
+        # Daily detail (row 3) and hourly chart (row 4) are built later
+        # by _build_deferred_sections
 
         # Close button
         close_btn = ctk.CTkButton(
@@ -575,48 +833,72 @@ class StatisticsWindow(ctk.CTkToplevel):
         )
         close_btn.grid(row=1, column=0, pady=15)
 
-    def _create_summary_section(self, parent: ctk.CTkFrame) -> None:
-        """Create summary statistics section with modern cards."""
-        # Get stats data
-        total_stats = self.stats_manager.get_total_stats()
-        weekly_stats = self.stats_manager.get_weekly_stats()
-        streak_info = self.stats_manager.get_streak_info()
+    def _build_deferred_sections(self) -> None:
+        """Build the daily detail and hourly chart sections."""
+        self._deferred_id = None
 
+        # ========== Daily Detail ==========
+        self.daily_detail = DailyDetailWidget(self._main_frame, self.stats_manager)
+        self.daily_detail.grid(row=3, column=0, sticky="ew", pady=(15, 0))
+        if self._pending_date is not None:
+            self.daily_detail.show_date(self._pending_date)
+            self._pending_date = None
+
+        # ========== Hourly Chart ==========
+        self.hourly_chart = HourlyChartWidget(self._main_frame, self.stats_manager)
+        self.hourly_chart.grid(row=4, column=0, sticky="ew", pady=(15, 0))
+
+    def _build_summary_section(self, parent: ctk.CTkFrame) -> None:
+        """Create summary statistics section with modern cards."""
         # Summary cards container
         summary_frame = ctk.CTkFrame(parent, fg_color="transparent")
         summary_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
         summary_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
+        # Cards show a placeholder until _on_summary_loaded fills them in
         # Total touches card
-        card1 = SummaryCard(
+        self._total_card = SummaryCard(
             summary_frame,
             t('stats_total_all_time'),
-            str(total_stats['total_touches']),
+            "…",
             icon="🖐️",
             color="#e74c3c"
         )
-        card1.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        self._total_card.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
 
         # Daily average card
-        card2 = SummaryCard(
+        self._weekly_card = SummaryCard(
             summary_frame,
             t('stats_weekly_avg'),
-            f"{weekly_stats.daily_average:.1f}",
+            "…",
             icon="📊",
             color="#f39c12"
         )
-        card2.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        self._weekly_card.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
         # Streak card
-        streak_days = streak_info['current_streak']
-        card3 = SummaryCard(
+        self._streak_card = SummaryCard(
             summary_frame,
             t('stats_streak'),
-            t('stats_days').replace("{n}", str(streak_days)),
+            "…",
             icon="🏆",
             color="#27ae60"
         )
-        card3.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        self._streak_card.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+
+        self._refresh_summary_section()
+
+    def _refresh_summary_section(self) -> None:
+        """Reload the summary card values (the cards themselves are reused)."""
+        _run_async(self, self.stats_manager.get_summary_bundle, callback=self._on_summary_loaded)
+
+    def _on_summary_loaded(self, summary: SummaryBundle) -> None:
+        """Fill the summary cards with queried data."""
+        total_stats, weekly_stats, streak_info = summary.total, summary.weekly, summary.streak
+        self._total_card.update_value(str(total_stats['total_touches']))
+        self._weekly_card.update_value(f"{weekly_stats.daily_average:.1f}")
+        streak_days = streak_info['current_streak']
+        self._streak_card.update_value(t('stats_days').replace("{n}", str(streak_days)))
 
     def _create_legend(self, parent: ctk.CTkFrame) -> None:
         """Create color legend for calendar."""
@@ -624,23 +906,33 @@ class StatisticsWindow(ctk.CTkToplevel):
         legend_inner.pack(anchor="center")
 
         # Good (no touches)
-        good_box = ctk.CTkFrame(legend_inner, fg_color="#1e3a2f", width=16, height=16, corner_radius=4)
+        good_box = ctk.CTkFrame(legend_inner, fg_color=NO_TOUCH_BG_COLOR, width=16, height=16, corner_radius=4)
         good_box.pack(side="left", padx=(0, 5))
-        good_label = ctk.CTkLabel(legend_inner, text="0", font=ctk.CTkFont(size=11), text_color="gray")
+        good_label = ctk.CTkLabel(legend_inner, text="0", font=_font(11), text_color="gray")
         good_label.pack(side="left", padx=(0, 20))
 
         # Medium
         med_box = ctk.CTkFrame(legend_inner, fg_color="#f39c12", width=16, height=16, corner_radius=4)
         med_box.pack(side="left", padx=(0, 5))
-        med_label = ctk.CTkLabel(legend_inner, text="1-5", font=ctk.CTkFont(size=11), text_color="gray")
+        med_label = ctk.CTkLabel(legend_inner, text="1-5", font=_font(11), text_color="gray")
         med_label.pack(side="left", padx=(0, 20))
 
         # High
         high_box = ctk.CTkFrame(legend_inner, fg_color="#e74c3c", width=16, height=16, corner_radius=4)
         high_box.pack(side="left", padx=(0, 5))
-        high_label = ctk.CTkLabel(legend_inner, text="6+", font=ctk.CTkFont(size=11), text_color="gray")
+        high_label = ctk.CTkLabel(legend_inner, text="6+", font=_font(11), text_color="gray")
         high_label.pack(side="left")
 
+    def invalidate(self, date_str: str) -> None:
+        """Drop cached statistics affected by a touch logged on date_str."""
+        self.calendar.invalidate(date_str)
+        self._refresh_summary_section()
+        if self.hourly_chart is not None:
+            self.hourly_chart.invalidate()
+
     def _on_date_select(self, date_str: str) -> None:
         """Handle date selection from calendar."""
+        if self.daily_detail is None:
+            self._pending_date = date_str  # Shown once the section is built
+            return
         self.daily_detail.show_date(date_str)
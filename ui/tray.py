@@ -1,8 +1,10 @@
 """System tray functionality."""
 import threading
 from pathlib import Path
-from typing import Callable, Optional
-from PIL import Image, ImageDraw
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+from PIL import Image
 import pystray
 
 from utils.i18n import t
@@ -11,10 +13,36 @@ from utils.i18n import t
 # Path to the app icon
 APP_ICON_PATH = Path(__file__).parent.parent / "assets" / "icon.ico"
 
+FALLBACK_ICON_SIZE = 64
+
+
+@lru_cache(maxsize=1)
+def _fallback_icon_masks() -> Tuple[np.ndarray, np.ndarray]:
+    """Pixel masks of the fallback icon: (colored disk, white outline and X)."""
+    size = FALLBACK_ICON_SIZE
+    # Pixel centers, matching PIL's ellipse/line rasterization closely enough
+    y, x = np.mgrid[0:size, 0:size] + 0.5
+
+    # Circle filling pixels 4..size-4 (inclusive, as PIL's ellipse) with a 1px outline
+    center, radius = (size + 1) / 2, (size + 1) / 2 - 4
+    dist = np.hypot(x - center, y - center)
+    disk = dist <= radius
+    outline = disk & (dist > radius - 1)
+
+    # "X" from (20, 20) to (size-20, size-20), 4px wide strokes
+    in_box = (x >= 20) & (x <= size - 19) & (y >= 20) & (y <= size - 19)
+    half_width = 2 * np.sqrt(2)  # Perpendicular half-width measured along x - y
+    cross = in_box & ((np.abs(x - y) <= half_width) | (np.abs(x + y - size - 1) <= half_width))
+
+    return disk, outline | cross
+
 
 class SystemTray:
     """System tray icon and menu."""
 
+    # Fallback icons drawn so far, by color
+    _FALLBACK_ICON_CACHE: Dict[str, Image.Image] = {}
+
     def __init__(self,
                  on_show: Optional[Callable] = None,
                  on_quit: Optional[Callable] = None,
@@ -26,6 +54,13 @@ class SystemTray:
         self._icon: Optional[pystray.Icon] = None
         self._thread: Optional[threading.Thread] = None
         self._is_monitoring = False
+        self._icon_image: Optional[Image.Image] = None  # Decoded once by _get_icon
+
+    def _get_icon(self) -> Image.Image:
+        """Get the tray icon image, loading it on first use."""
+        if self._icon_image is None:
+            self._icon_image = self._load_app_icon()
+        return self._icon_image
 
     def _load_app_icon(self) -> Image.Image:
         """Load the application icon from file."""
@@ -33,11 +68,15 @@ class SystemTray:
             if APP_ICON_PATH.exists():
                 # Load ico file and get the best size for tray (usually 64x64 or 32x32)
                 icon = Image.open(APP_ICON_PATH)
+                # Use the 64x64 image stored in the .ico if there is one
+                if (64, 64) in icon.info.get('sizes', ()):
+                    icon.size = (64, 64)
                 # Convert to RGBA if needed
                 if icon.mode != 'RGBA':
                     icon = icon.convert('RGBA')
-                # Resize to standard tray icon size
-                icon = icon.resize((64, 64), Image.Resampling.LANCZOS)
+                # Resize to standard tray icon size (a no-op for the stored 64x64 image)
+                if icon.size != (64, 64):
+                    icon = icon.resize((64, 64), Image.Resampling.BILINEAR)
                 return icon
         except Exception as e:
             print(f"Failed to load app icon: {e}")
@@ -47,9 +86,9 @@ class SystemTray:
 
     def _create_fallback_icon(self, color: str = "green") -> Image.Image:
         """Create a fallback icon image if app icon is not available."""
-        size = 64
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        cached = self._FALLBACK_ICON_CACHE.get(color)
+        if cached is not None:
+            return cached
 
         # Draw a hand symbol
         colors = {
@@ -60,26 +99,30 @@ class SystemTray:
         }
         fill_color = colors.get(color, colors["green"])
 
-        # Simple circle with hand icon
-        draw.ellipse([4, 4, size-4, size-4], fill=fill_color, outline=(255, 255, 255, 255))
-
-        # Draw a simple X for "don't touch"
-        draw.line([20, 20, size-20, size-20], fill=(255, 255, 255, 255), width=4)
-        draw.line([20, size-20, size-20, 20], fill=(255, 255, 255, 255), width=4)
+        # Simple circle with a white outline and a simple X for "don't touch",
+        # written with precomputed masks instead of PIL draw calls
+        disk, white = _fallback_icon_masks()
+        pixels = np.zeros((FALLBACK_ICON_SIZE, FALLBACK_ICON_SIZE, 4), dtype=np.uint8)
+        pixels[disk] = fill_color
+        pixels[white] = (255, 255, 255, 255)
+        image = Image.fromarray(pixels, 'RGBA')
 
+        self._FALLBACK_ICON_CACHE[color] = image
         return image
 
     def _create_menu(self) -> pystray.Menu:
-        """Create the tray menu."""
-        toggle_text = t('tray_stop') if self._is_monitoring else t('tray_start')
-
+        """Create the tray menu (once; item texts are re-read on every update)."""
         return pystray.Menu(
-            pystray.MenuItem(t('tray_open'), self._on_show_click, default=True),
-            pystray.MenuItem(toggle_text, self._on_toggle_click),
+            pystray.MenuItem(lambda item: t('tray_open'), self._on_show_click, default=True),
+            pystray.MenuItem(self._toggle_text, self._on_toggle_click),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem(t('tray_exit'), self._on_quit_click)
+            pystray.MenuItem(lambda item: t('tray_exit'), self._on_quit_click)
         )
 
+    def _toggle_text(self, item) -> str:
+        """Label of the start/stop menu item for the current state."""
+        return t('tray_stop') if self._is_monitoring else t('tray_start')
+
     def _on_show_click(self, icon, item) -> None:
         """Handle show menu item click."""
         if self.on_show:
@@ -89,7 +132,6 @@ class SystemTray:
         """Handle toggle menu item click."""
         if self.on_toggle:
             self.on_toggle()
-        self._update_menu()
 
     def _on_quit_click(self, icon, item) -> None:
         """Handle quit menu item click."""
@@ -98,9 +140,9 @@ class SystemTray:
             self.on_quit()
 
     def _update_menu(self) -> None:
-        """Update the menu items."""
+        """Refresh the menu item texts (the menu itself is reused)."""
         if self._icon:
-            self._icon.menu = self._create_menu()
+            self._icon.update_menu()
 
     def start(self) -> None:
         """Start the system tray icon."""
@@ -109,7 +151,7 @@ class SystemTray:
 
         self._icon = pystray.Icon(
             "dont-touch",
-            self._load_app_icon(),
+            self._get_icon(),
             t('tray_tooltip'),
             menu=self._create_menu()
         )
@@ -126,12 +168,12 @@ class SystemTray:
 
     def set_monitoring_state(self, is_monitoring: bool) -> None:
         """Update the monitoring state indicator."""
+        if is_monitoring == self._is_monitoring:
+            return
         self._is_monitoring = is_monitoring
 
-        if self._icon:
-            # Always use app icon, just update menu
-            self._icon.icon = self._load_app_icon()
-            self._update_menu()
+        # Always use app icon (already set in start), just refresh the toggle text
+        self._update_menu()
 
     def set_alert_state(self) -> None:
         """Set icon to alert state (red)."""
@@ -1,6 +1,8 @@
 """Alert management for notifications."""
+import ctypes
 import threading
 import os
+import wave
 from pathlib import Path
 from typing import Optional, Callable
 import winsound
@@ -8,6 +10,121 @@ import winsound
 from utils.i18n import t
 
 
+# winmm constants
+WAVE_MAPPER = 0xFFFFFFFF
+WAVE_FORMAT_PCM = 1
+CALLBACK_NULL = 0
+MMSYSERR_NOERROR = 0
+
+
+class _WAVEFORMATEX(ctypes.Structure):
+    _fields_ = [
+        ("wFormatTag", ctypes.c_ushort),
+        ("nChannels", ctypes.c_ushort),
+        ("nSamplesPerSec", ctypes.c_uint),
+        ("nAvgBytesPerSec", ctypes.c_uint),
+        ("nBlockAlign", ctypes.c_ushort),
+        ("wBitsPerSample", ctypes.c_ushort),
+        ("cbSize", ctypes.c_ushort),
+    ]
+
+
+class _WAVEHDR(ctypes.Structure):
+    _fields_ = [
+        ("lpData", ctypes.c_void_p),
+        ("dwBufferLength", ctypes.c_uint),
+        ("dwBytesRecorded", ctypes.c_uint),
+        ("dwUser", ctypes.c_size_t),
+        ("dwFlags", ctypes.c_uint),
+        ("dwLoops", ctypes.c_uint),
+        ("lpNext", ctypes.c_void_p),
+        ("reserved", ctypes.c_size_t),
+    ]
+
+
+class _WaveOutPlayer:
+    """Plays one PCM .wav clip through a waveOut device kept open until close().
+
+    The clip is decoded and its buffer prepared once, so playing it only
+    resets the device and resubmits that buffer instead of setting up a
+    new playback session like PlaySound does.
+    """
+
+    def __init__(self, path: Path):
+        with wave.open(str(path), 'rb') as wav:
+            channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            rate = wav.getframerate()
+            pcm = wav.readframes(wav.getnframes())
+
+        block_align = channels * sample_width
+        self._format = _WAVEFORMATEX(
+            WAVE_FORMAT_PCM, channels, rate, rate * block_align,
+            block_align, sample_width * 8, 0
+        )
+
+        winmm = ctypes.WinDLL("winmm")
+        winmm.waveOutOpen.argtypes = [
+            ctypes.POINTER(ctypes.c_void_p), ctypes.c_uint, ctypes.POINTER(_WAVEFORMATEX),
+            ctypes.c_size_t, ctypes.c_size_t, ctypes.c_uint
+        ]
+        for name in ("waveOutPrepareHeader", "waveOutUnprepareHeader", "waveOutWrite"):
+            getattr(winmm, name).argtypes = [ctypes.c_void_p, ctypes.POINTER(_WAVEHDR), ctypes.c_uint]
+        for name in ("waveOutReset", "waveOutClose"):
+            getattr(winmm, name).argtypes = [ctypes.c_void_p]
+        self._winmm = winmm
+
+        self._handle = ctypes.c_void_p()
+        self._check(winmm.waveOutOpen(
+            ctypes.byref(self._handle), WAVE_MAPPER, ctypes.byref(self._format),
+            0, 0, CALLBACK_NULL
+        ), "waveOutOpen")
+
+        # The buffer must stay alive (and unmoved) while the header is prepared
+        self._buffer = ctypes.create_string_buffer(pcm, len(pcm))
+        self._header = _WAVEHDR(
+            lpData=ctypes.cast(self._buffer, ctypes.c_void_p),
+            dwBufferLength=len(pcm)
+        )
+        result = winmm.waveOutPrepareHeader(
+            self._handle, ctypes.byref(self._header), ctypes.sizeof(_WAVEHDR)
+        )
+        if result != MMSYSERR_NOERROR:
+            winmm.waveOutClose(self._handle)
+            self._check(result, "waveOutPrepareHeader")
+
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def _check(result: int, call: str) -> None:
+        if result != MMSYSERR_NOERROR:
+            raise OSError(f"{call} failed with MMRESULT {result}")
+
+    def play(self) -> None:
+        """Play the clip from the start, cutting off a previous playback."""
+        with self._lock:
+            if self._closed:
+                return
+            # Returns the header to us if it is still queued
+            self._winmm.waveOutReset(self._handle)
+            self._check(self._winmm.waveOutWrite(
+                self._handle, ctypes.byref(self._header), ctypes.sizeof(_WAVEHDR)
+            ), "waveOutWrite")
+
+    def close(self) -> None:
+        """Stop playback and release the device."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._winmm.waveOutReset(self._handle)
+            self._winmm.waveOutUnprepareHeader(
+                self._handle, ctypes.byref(self._header), ctypes.sizeof(_WAVEHDR)
+            )
+            self._winmm.waveOutClose(self._handle)
+
+
 class AlertManager:
     """Manages visual and audio alerts."""
 
@@ -22,6 +139,20 @@ class AlertManager:
         self.on_popup = on_popup  # Callback for popup display
         self._sound_thread: Optional[threading.Thread] = None
 
+        # Alert sound loaded once: a waveOut device kept open for low-latency
+        # playback, with the raw file bytes as a PlaySound fallback
+        self._player: Optional[_WaveOutPlayer] = None
+        self._wav_bytes: Optional[bytes] = None
+        if self.DEFAULT_ALERT_SOUND.exists():
+            try:
+                self._player = _WaveOutPlayer(self.DEFAULT_ALERT_SOUND)
+            except Exception as e:
+                print(f"waveOut playback unavailable, using PlaySound: {e}")
+                try:
+                    self._wav_bytes = self.DEFAULT_ALERT_SOUND.read_bytes()
+                except OSError as e:
+                    print(f"Failed to load alert sound: {e}")
+
     def trigger_alert(self, message: Optional[str] = None) -> None:
         """Trigger both sound and popup alerts."""
         if message is None:
@@ -34,14 +165,20 @@ class AlertManager:
             self.on_popup(message)
 
     def _play_sound(self) -> None:
-        """Play alert sound in a separate thread."""
+        """Play alert sound without blocking the caller."""
+        if self._player is not None:
+            try:
+                self._player.play()  # Only submits the prepared buffer
+                return
+            except Exception as e:
+                print(f"Failed to play sound: {e}")
+
         def play():
             try:
-                if self.DEFAULT_ALERT_SOUND.exists():
-                    winsound.PlaySound(
-                        str(self.DEFAULT_ALERT_SOUND),
-                        winsound.SND_FILENAME | winsound.SND_ASYNC
-                    )
+                if self._wav_bytes is not None:
+                    # SND_MEMORY can't be combined with SND_ASYNC; this
+                    # thread already keeps playback off the caller
+                    winsound.PlaySound(self._wav_bytes, winsound.SND_MEMORY)
                 else:
                     # Fallback to system beep
                     winsound.Beep(1000, 500)  # 1000Hz for 500ms
@@ -53,6 +190,12 @@ class AlertManager:
             self._sound_thread = threading.Thread(target=play, daemon=True)
             self._sound_thread.start()
 
+    def close(self) -> None:
+        """Release the audio device."""
+        if self._player is not None:
+            self._player.close()
+            self._player = None
+
     def set_sound_enabled(self, enabled: bool) -> None:
         """Enable or disable sound alerts."""
         self.sound_enabled = enabled
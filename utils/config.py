@@ -1,11 +1,17 @@
 """Configuration management for the application."""
 import json
 import os
+import queue
+import threading
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
+# Marks an unknown key in Config.set
+_MISSING = object()
+
+
 @dataclass
 class AppConfig:
     """Application configuration settings."""
@@ -24,6 +30,9 @@ class AppConfig:
     start_minimized: bool = False
     auto_start_detection: bool = False  # Automatically start detection when app launches
     frame_skip: int = 2  # Process every Nth frame for performance
+    model_complexity: int = 0  # MediaPipe model complexity (0 = lite/fastest, 1 = full)
+    low_power_preview: bool = False  # Nearest-neighbor preview scaling (cheapest)
+    opencv_threads: int = 0  # OpenCV worker threads (0 = half the CPU cores)
 
     # Window settings
     window_width: int = 1050
@@ -33,16 +42,27 @@ class AppConfig:
     language: str = ""  # Empty string means auto-detect from system
 
 
+# Names of the persisted settings, in declaration order
+APPCONFIG_FIELDS = tuple(f.name for f in fields(AppConfig))
+
+
 class Config:
     """Configuration manager with file persistence."""
 
     DEFAULT_CONFIG_DIR = Path.home() / ".dont-touch"
     CONFIG_FILE = "config.json"
+    SAVE_DELAY = 0.5  # Quiet period (seconds) before a requested save is written
 
     def __init__(self, config_dir: Optional[Path] = None):
         self.config_dir = config_dir or self.DEFAULT_CONFIG_DIR
         self.config_path = self.config_dir / self.CONFIG_FILE
         self.settings = AppConfig()
+
+        # Saves are written by one writer thread (started on first save),
+        # which coalesces snapshots queued within SAVE_DELAY of each other
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
         self._ensure_config_dir()
         self.load()
 
@@ -52,22 +72,64 @@ class Config:
 
     def load(self) -> None:
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Update only existing fields
-                    for key, value in data.items():
-                        if hasattr(self.settings, key):
-                            setattr(self.settings, key, value)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Failed to load config: {e}")
+        try:
+            # One read, parsed from bytes (json detects the UTF-8 encoding)
+            data = json.loads(self.config_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
+            print(f"Failed to load config: {e}")
+            return
+
+        # Update only existing fields
+        for key, value in data.items():
+            if hasattr(self.settings, key):
+                setattr(self.settings, key, value)
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Queue a save; returns immediately and rapid saves are written once."""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        # AppConfig fields are all flat scalars, so reading them by name is a
+        # complete snapshot (asdict() deep-copies field by field)
+        settings = self.settings
+        self._write_queue.put({name: getattr(settings, name) for name in APPCONFIG_FIELDS})
+
+    def flush(self) -> None:
+        """Write pending saves now and wait for them (e.g. before the app exits)."""
+        if self._writer_thread is None:
+            return
+        self._write_queue.put(None)  # Ends the writer's quiet-period wait
+        self._write_queue.join()
+
+    def _writer_loop(self) -> None:
+        """Write queued settings snapshots, keeping only the latest of a burst."""
+        while True:
+            data = self._write_queue.get()
+            taken = 1
+
+            # Wait for the burst to end; None asks for an immediate write
+            while data is not None:
+                try:
+                    newer = self._write_queue.get(timeout=self.SAVE_DELAY)
+                except queue.Empty:
+                    break
+                taken += 1
+                if newer is None:
+                    break
+                data = newer
+
+            if data is not None:
+                self._save_now(data)
+            for _ in range(taken):
+                self._write_queue.task_done()
+
+    def _save_now(self, data: dict) -> None:
+        """Save a settings snapshot to file."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.settings), f, indent=2)
+            # Serialize in one go and write once, instead of json.dump's many small writes
+            self.config_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
         except IOError as e:
             print(f"Failed to save config: {e}")
 
@@ -81,7 +143,9 @@ class Config:
         return getattr(self.settings, key, default)
 
     def set(self, key: str, value) -> None:
-        """Set a configuration value."""
-        if hasattr(self.settings, key):
-            setattr(self.settings, key, value)
-            self.save()
+        """Set a configuration value (saving only if it changed)."""
+        current = getattr(self.settings, key, _MISSING)
+        if current is _MISSING or current == value:
+            return
+        setattr(self.settings, key, value)
+        self.save()
@@ -2,6 +2,7 @@
 import json
 import locale
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -15,6 +16,11 @@ SUPPORTED_LANGUAGES = {
     'ru': 'Русский'
 }
 
+# Language selector entries: '' (auto-detect) followed by the supported codes,
+# and the display names in the same order (without the "Auto" entry)
+LANGUAGE_CODES = ('',) + tuple(SUPPORTED_LANGUAGES)
+LANGUAGE_NAMES = tuple(SUPPORTED_LANGUAGES.values())
+
 # Default fallback language
 DEFAULT_LANGUAGE = 'en'
 
@@ -38,40 +44,55 @@ class I18n:
         if self._initialized:
             return
         self._initialized = True
-        self._load_all_translations()
-
-    def _load_all_translations(self) -> None:
-        """Load all translation files from locales directory."""
-        if not self._translations_dir.exists():
-            self._translations_dir.mkdir(parents=True, exist_ok=True)
-            return
-
-        for lang_code in SUPPORTED_LANGUAGES.keys():
-            lang_file = self._translations_dir / f"{lang_code}.json"
-            if lang_file.exists():
-                try:
-                    with open(lang_file, 'r', encoding='utf-8') as f:
-                        self._translations[lang_code] = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Failed to load translation file {lang_file}: {e}")
-                    self._translations[lang_code] = {}
+        # Translations for the current language merged over the default
+        # language, so t() needs a single lookup
+        self._active: Dict[str, str] = {}
+        # Only the system language and the fallback are loaded up front;
+        # other languages are read when set_language() selects them
+        self._system_language = self._detect_system_language()
+        self._current_language = self._system_language
+        self._rebuild_active()
+
+    def _rebuild_active(self) -> None:
+        """Merge the current language's translations over the default language."""
+        base = self._load_one(DEFAULT_LANGUAGE)
+        overlay = self._load_one(self._current_language)
+        self._active = {**base, **overlay}
+
+    def _load_one(self, lang_code: str) -> Dict[str, str]:
+        """Load one language's translation file on first use."""
+        translations = self._translations.get(lang_code)
+        if translations is not None:
+            return translations
+
+        translations = {}
+        lang_file = self._translations_dir / f"{lang_code}.json"
+        if lang_file.exists():
+            try:
+                with open(lang_file, 'r', encoding='utf-8') as f:
+                    translations = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Failed to load translation file {lang_file}: {e}")
+        self._translations[lang_code] = translations
+        return translations
 
     def get_system_language(self) -> str:
+        """Get the supported language code matching the system language (detected once)."""
+        return self._system_language
+
+    @staticmethod
+    def _detect_system_language() -> str:
         """Detect system language and return matching supported language code."""
         try:
             # Get system locale
             system_locale = locale.getdefaultlocale()[0]
             if system_locale:
-                # Extract language code (e.g., 'ko_KR' -> 'ko')
+                # Extract language code (e.g., 'ko_KR' -> 'ko', 'zh_TW' -> 'zh')
                 lang_code = system_locale.split('_')[0].lower()
 
                 # Check if language is supported
                 if lang_code in SUPPORTED_LANGUAGES:
                     return lang_code
-
-                # Special case for Chinese variants
-                if lang_code == 'zh':
-                    return 'zh'
         except Exception:
             pass
 
@@ -88,6 +109,8 @@ class I18n:
         """
         if lang_code in SUPPORTED_LANGUAGES:
             self._current_language = lang_code
+            self._rebuild_active()
+            _lookup.cache_clear()
             return True
         return False
 
@@ -110,34 +133,41 @@ class I18n:
         Returns:
             Translated string, or key if translation not found
         """
-        # Try current language
-        translation = self._translations.get(self._current_language, {}).get(key)
+        # Argument-free translations are memoized per (language, key)
+        if not kwargs:
+            return _lookup(self._current_language, key)
 
-        # Fallback to default language
-        if translation is None and self._current_language != DEFAULT_LANGUAGE:
-            translation = self._translations.get(DEFAULT_LANGUAGE, {}).get(key)
+        # Current language, with the default language as fallback
+        translation = self._active.get(key)
 
         # Return key if no translation found
         if translation is None:
             return key
 
-        # Apply format arguments if provided
-        if kwargs:
-            try:
-                return translation.format(**kwargs)
-            except KeyError:
-                return translation
-
-        return translation
+        # Apply format arguments
+        try:
+            return translation.format(**kwargs)
+        except KeyError:
+            return translation
 
     def get_supported_languages(self) -> Dict[str, str]:
         """Get dictionary of supported languages {code: display_name}."""
         return SUPPORTED_LANGUAGES.copy()
 
     def reload_translations(self) -> None:
-        """Reload all translation files."""
+        """Reload the current and fallback translation files."""
         self._translations.clear()
-        self._load_all_translations()
+        self._rebuild_active()
+        _lookup.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _lookup(language: str, key: str) -> str:
+    """Translation of a key without format arguments, memoized per language.
+
+    The language is only part of the cache key; set_language() clears the cache.
+    """
+    return _i18n._active.get(key, key)
 
 
 # Global instance for easy access
@@ -159,9 +189,8 @@ def get_language() -> str:
     return _i18n.get_language()
 
 
-def t(key: str, **kwargs) -> str:
-    """Translate a key to current language."""
-    return _i18n.t(key, **kwargs)
+# Translate a key to current language (bound directly to skip a wrapper call)
+t = _i18n.t
 
 
 def get_supported_languages() -> Dict[str, str]:
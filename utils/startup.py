@@ -1,8 +1,10 @@
 """Windows startup management utility."""
+import atexit
 import sys
 import os
 import winreg
 from pathlib import Path
+from typing import Optional
 
 
 class StartupManager:
@@ -11,6 +13,11 @@ class StartupManager:
     APP_NAME = "Don't Touch"
     REGISTRY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+    # Last known registration state (None = not queried yet)
+    _cached_state: Optional[bool] = None
+    # Run key handle shared by all operations (opened on first use)
+    _key = None
+
     @classmethod
     def get_executable_path(cls) -> str:
         """Get the path to the executable or script with --minimized flag."""
@@ -25,40 +32,54 @@ class StartupManager:
 
     @classmethod
     def is_registered(cls) -> bool:
-        """Check if application is registered in startup."""
-        try:
-            key = winreg.OpenKey(
+        """Check if application is registered in startup (cached after the first query)."""
+        if cls._cached_state is None:
+            cls._cached_state = cls._query_registered()
+        return cls._cached_state
+
+    @classmethod
+    def _get_key(cls):
+        """Get the Run key handle, opened once and kept for the process lifetime."""
+        if cls._key is None:
+            cls._key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 cls.REGISTRY_PATH,
                 0,
-                winreg.KEY_READ
+                winreg.KEY_READ | winreg.KEY_SET_VALUE
             )
-            try:
-                winreg.QueryValueEx(key, cls.APP_NAME)
-                return True
-            except FileNotFoundError:
-                return False
-            finally:
-                winreg.CloseKey(key)
+            atexit.register(cls._close_key)
+        return cls._key
+
+    @classmethod
+    def _close_key(cls) -> None:
+        """Close the cached Run key handle."""
+        if cls._key is not None:
+            winreg.CloseKey(cls._key)
+            cls._key = None
+
+    @classmethod
+    def _query_registered(cls) -> bool:
+        """Read the registration state from the registry."""
+        try:
+            winreg.QueryValueEx(cls._get_key(), cls.APP_NAME)
+            return True
         except WindowsError:
+            # Value not present (FileNotFoundError) or key not accessible
             return False
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget the cached state so the next is_registered() reads the registry."""
+        cls._cached_state = None
+
     @classmethod
     def register(cls) -> bool:
         """Register application to run at startup."""
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                cls.REGISTRY_PATH,
-                0,
-                winreg.KEY_SET_VALUE
-            )
-            try:
-                exe_path = cls.get_executable_path()
-                winreg.SetValueEx(key, cls.APP_NAME, 0, winreg.REG_SZ, exe_path)
-                return True
-            finally:
-                winreg.CloseKey(key)
+            exe_path = cls.get_executable_path()
+            winreg.SetValueEx(cls._get_key(), cls.APP_NAME, 0, winreg.REG_SZ, exe_path)
+            cls._cached_state = True
+            return True
         except WindowsError as e:
             print(f"Failed to register startup: {e}")
             return False
@@ -67,20 +88,13 @@ class StartupManager:
     def unregister(cls) -> bool:
         """Remove application from startup."""
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                cls.REGISTRY_PATH,
-                0,
-                winreg.KEY_SET_VALUE
-            )
-            try:
-                winreg.DeleteValue(key, cls.APP_NAME)
-                return True
-            except FileNotFoundError:
-                # Already not registered
-                return True
-            finally:
-                winreg.CloseKey(key)
+            winreg.DeleteValue(cls._get_key(), cls.APP_NAME)
+            cls._cached_state = False
+            return True
+        except FileNotFoundError:
+            # Already not registered
+            cls._cached_state = False
+            return True
         except WindowsError as e:
             print(f"Failed to unregister startup: {e}")
             return False
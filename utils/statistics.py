@@ -1,12 +1,73 @@
 """Statistics management for tracking face-touching events."""
-import json
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from dataclasses import dataclass, asdict
 
 
+# daily_summaries keeps one touch-count column per hour of day
+_HOUR_COLUMNS = tuple(f"h{hour:02d}" for hour in range(24))
+
+# Statements run for every logged event, kept as single literals so the
+# connection's prepared-statement cache always hits
+_INSERT_EVENT_SQL = '''
+    INSERT INTO touch_events (timestamp, duration, closest_distance, date, hour)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_DAY_TOTALS_SQL = f'''
+    SELECT COUNT(*), SUM(duration),
+           substr(MIN(timestamp), 12, 5), substr(MAX(timestamp), 12, 5),
+           {", ".join(f"SUM(hour = {hour})" for hour in range(24))}
+    FROM touch_events WHERE date = ?
+'''
+# Recompute one month's rollup (YYYY-MM) from its daily summaries
+_ROLLUP_MONTH_SQL = '''
+    INSERT OR REPLACE INTO monthly_summaries
+    (year_month, total_touches, total_duration, days_with_touches)
+    SELECT ?1, SUM(total_touches), SUM(total_duration), COUNT(*)
+    FROM daily_summaries
+    WHERE date >= ?1 || '-01' AND date <= ?1 || '-31'
+    GROUP BY substr(date, 1, 7)
+'''
+# Keeps the daily summary and monthly rollup current as events are inserted
+_EVENT_SUMMARY_TRIGGER_SQL = f'''
+    CREATE TRIGGER IF NOT EXISTS trg_events_summary AFTER INSERT ON touch_events
+    BEGIN
+        INSERT INTO daily_summaries
+        (date, total_touches, total_duration, first_touch, last_touch, {", ".join(_HOUR_COLUMNS)})
+        VALUES (
+            NEW.date, 1, NEW.duration,
+            substr(NEW.timestamp, 12, 5), substr(NEW.timestamp, 12, 5),
+            {", ".join(f"NEW.hour = {hour}" for hour in range(24))}
+        )
+        ON CONFLICT(date) DO UPDATE SET
+            total_touches = total_touches + 1,
+            total_duration = total_duration + excluded.total_duration,
+            last_touch = excluded.last_touch,
+            {", ".join(f"{column} = {column} + excluded.{column}" for column in _HOUR_COLUMNS)};
+
+        INSERT INTO monthly_summaries
+        (year_month, total_touches, total_duration, days_with_touches)
+        VALUES (substr(NEW.date, 1, 7), 1, NEW.duration, 1)
+        ON CONFLICT(year_month) DO UPDATE SET
+            total_touches = total_touches + 1,
+            total_duration = total_duration + excluded.total_duration,
+            days_with_touches = days_with_touches + (
+                SELECT total_touches = 1 FROM daily_summaries WHERE date = NEW.date
+            );
+    END
+'''
+_UPSERT_SUMMARY_SQL = f'''
+    INSERT OR REPLACE INTO daily_summaries
+    (date, total_touches, total_duration, first_touch, last_touch, {", ".join(_HOUR_COLUMNS)})
+    VALUES ({", ".join("?" * (5 + len(_HOUR_COLUMNS)))})
+'''
+
+
 @dataclass
 class TouchEvent:
     """A single face-touching event."""
@@ -39,25 +100,104 @@ class WeeklyStats:
     daily_counts: Dict[str, int]  # Date -> count
 
 
+@dataclass
+class SummaryBundle:
+    """Overall, weekly and streak statistics from a single query."""
+    total: Dict[str, Any]  # Same keys as get_total_stats()
+    weekly: WeeklyStats  # Same as get_weekly_stats() for the last 7 days
+    streak: Dict[str, Any]  # Same keys as get_streak_info()
+
+
+@dataclass
+class MonthlyCalendar:
+    """Touch counts for each day of a month."""
+    values: Dict[int, int]  # Day (1-31) -> count
+    max_value: int  # Highest daily count (at least 1)
+
+
+@dataclass
+class HourlyPattern:
+    """Aggregated touch counts per hour of day."""
+    values: Dict[int, int]  # Hour (0-23) -> count
+    max_value: int  # Highest hourly count (at least 1)
+
+
 class StatisticsManager:
     """Manages statistics tracking and persistence using SQLite."""
 
     DEFAULT_DB_DIR = Path.home() / ".dont-touch"
     DB_FILE = "statistics.db"
+    FLUSH_DELAY = 2.0  # Seconds logged events wait in memory before being written
+    FLUSH_THRESHOLD = 32  # Buffered events that trigger an immediate write
+    IMPORT_CHUNK_SIZE = 500  # Rows per executemany call in log_events
 
     def __init__(self, db_dir: Optional[Path] = None):
         self.db_dir = db_dir or self.DEFAULT_DB_DIR
         self.db_path = self.db_dir / self.DB_FILE
         self._ensure_db_dir()
+
+        # One connection for the manager's lifetime, shared by the UI, the
+        # statistics worker threads and event logging; _lock serializes use
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False,
+            cached_statements=256
+        )
+        # WAL avoids rewriting a rollback journal per commit, NORMAL skips
+        # an fsync per commit (safe with WAL), 8 MB page cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-8000")
+
         self._init_database()
 
+        # Logged events not yet written: (timestamp, duration, closest_distance, date, hour)
+        self._pending: List[Tuple[str, float, float, str, int]] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._closed = False  # Set by close(); later events are dropped
+        atexit.register(self._flush)
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Use the shared connection for queries (buffered events are written first)."""
+        with self._lock:
+            self._flush()
+            yield self._conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Use the shared connection inside a write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Write buffered events and close the database connection.
+
+        Events logged after this (e.g. by a capture thread still shutting
+        down) are dropped.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            self._conn.close()
+        atexit.unregister(self._flush)
+
     def _ensure_db_dir(self) -> None:
         """Create database directory if it doesn't exist."""
         self.db_dir.mkdir(parents=True, exist_ok=True)
 
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
 
             # Events table - stores individual touch events
@@ -72,27 +212,82 @@ class StatisticsManager:
                 )
             ''')
 
-            # Daily summaries table - cached daily statistics
-            cursor.execute('''
+            # Daily summaries table - cached daily statistics, with the
+            # hourly distribution in columns h00..h23
+            hour_columns = ", ".join(
+                f"{column} INTEGER NOT NULL DEFAULT 0" for column in _HOUR_COLUMNS
+            )
+            cursor.execute(f'''
                 CREATE TABLE IF NOT EXISTS daily_summaries (
                     date TEXT PRIMARY KEY,
                     total_touches INTEGER NOT NULL,
                     total_duration REAL NOT NULL,
                     first_touch TEXT,
                     last_touch TEXT,
-                    hourly_distribution TEXT
+                    {hour_columns}
                 )
             ''')
 
-            # Create indexes for faster queries
+            # Monthly rollup of the daily summaries, for all-time totals
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_events_date ON touch_events(date)
+                CREATE TABLE IF NOT EXISTS monthly_summaries (
+                    year_month TEXT PRIMARY KEY,
+                    total_touches INTEGER NOT NULL,
+                    total_duration REAL NOT NULL,
+                    days_with_touches INTEGER NOT NULL
+                )
+            ''')
+            if cursor.execute('SELECT 1 FROM monthly_summaries LIMIT 1').fetchone() is None:
+                cursor.execute('''
+                    INSERT INTO monthly_summaries
+                    SELECT substr(date, 1, 7), SUM(total_touches), SUM(total_duration), COUNT(*)
+                    FROM daily_summaries
+                    GROUP BY substr(date, 1, 7)
+                ''')
+
+            self._migrate_hourly_columns(conn)
+            cursor.execute(_EVENT_SUMMARY_TRIGGER_SQL)
+
+            # Create indexes for faster queries: date ranges grouped by hour,
+            # and per-day timestamp ranges/ordering
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_events_date_hour ON touch_events(date, hour)
             ''')
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_events_timestamp ON touch_events(timestamp)
+                CREATE INDEX IF NOT EXISTS idx_events_date_ts ON touch_events(date, timestamp)
             ''')
 
-            conn.commit()
+            # Covering index for the calendar, weekly and streak queries, which
+            # only read (date, total_touches) from the summaries
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_summaries_date_touches
+                ON daily_summaries(date, total_touches)
+            ''')
+
+            # Indexes superseded by the composite ones above
+            cursor.execute('DROP INDEX IF EXISTS idx_events_date')
+            cursor.execute('DROP INDEX IF EXISTS idx_events_timestamp')
+
+    def _migrate_hourly_columns(self, conn: sqlite3.Connection) -> None:
+        """Move summaries from the old hourly_distribution JSON column to h00..h23."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(daily_summaries)")}
+        if _HOUR_COLUMNS[0] in columns:
+            return
+
+        for column in _HOUR_COLUMNS:
+            conn.execute(
+                f"ALTER TABLE daily_summaries ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+            )
+
+        # Rebuild every summary from its events to fill the new columns
+        dates = [row[0] for row in conn.execute("SELECT DISTINCT date FROM touch_events")]
+        for date in dates:
+            self._update_daily_summary(conn, date)
+
+        try:
+            conn.execute("ALTER TABLE daily_summaries DROP COLUMN hourly_distribution")
+        except sqlite3.OperationalError:
+            pass  # SQLite < 3.35; the unused column stays
 
     def log_event(self, duration: float, closest_distance: float) -> None:
         """Log a new face-touching event.
@@ -103,54 +298,82 @@ class StatisticsManager:
         """
         now = datetime.now()
         timestamp = now.isoformat()
-        date = now.strftime("%Y-%m-%d")
+        date = timestamp[:10]  # YYYY-MM-DD prefix of the ISO timestamp
         hour = now.hour
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO touch_events (timestamp, duration, closest_distance, date, hour)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (timestamp, duration, closest_distance, date, hour))
-            conn.commit()
-
-        # Update daily summary cache
-        self._update_daily_summary(date)
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append((timestamp, duration, closest_distance, date, hour))
+            if len(self._pending) >= self.FLUSH_THRESHOLD:
+                self._flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
-    def _update_daily_summary(self, date: str) -> None:
-        """Update the cached daily summary for a given date."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+    def log_events(self, events: Iterable[Tuple[float, float, datetime]]) -> int:
+        """Log many past events at once (e.g. when restoring a backup).
 
-            # Get all events for the date
-            cursor.execute('''
-                SELECT timestamp, duration, hour FROM touch_events
-                WHERE date = ?
-                ORDER BY timestamp
-            ''', (date,))
+        Args:
+            events: (duration, closest_distance, timestamp) tuples, in any order.
 
-            events = cursor.fetchall()
-            if not events:
+        Returns:
+            Number of events logged.
+        """
+        rows = [
+            (timestamp.isoformat(), duration, closest_distance,
+             timestamp.strftime("%Y-%m-%d"), timestamp.hour)
+            for duration, closest_distance, timestamp in events
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            if self._closed:
+                return 0
+            self._flush()
+            with self._write() as conn:
+                for i in range(0, len(rows), self.IMPORT_CHUNK_SIZE):
+                    conn.executemany(_INSERT_EVENT_SQL, rows[i:i + self.IMPORT_CHUNK_SIZE])
+
+                # The insert trigger assumes events arrive in time order;
+                # rebuild each touched day once to get first/last touch right
+                for date in {row[3] for row in rows}:
+                    self._update_daily_summary(conn, date)
+
+        return len(rows)
+
+    def _flush(self) -> None:
+        """Write buffered events in one transaction (the summaries follow by trigger)."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._closed or not self._pending:
                 return
+            events, self._pending = self._pending, []
 
-            total_touches = len(events)
-            total_duration = sum(e[1] for e in events)
-            first_touch = datetime.fromisoformat(events[0][0]).strftime("%H:%M")
-            last_touch = datetime.fromisoformat(events[-1][0]).strftime("%H:%M")
+            with self._write() as conn:
+                conn.executemany(_INSERT_EVENT_SQL, events)
 
-            # Calculate hourly distribution
-            hourly = {}
-            for e in events:
-                hour = e[2]
-                hourly[hour] = hourly.get(hour, 0) + 1
+    def _update_daily_summary(self, conn: sqlite3.Connection, date: str) -> None:
+        """Rebuild the cached daily summary for a given date from its events
+        (inside a write transaction)."""
+        cursor = conn.cursor()
 
-            cursor.execute('''
-                INSERT OR REPLACE INTO daily_summaries
-                (date, total_touches, total_duration, first_touch, last_touch, hourly_distribution)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (date, total_touches, total_duration, first_touch, last_touch, json.dumps(hourly)))
+        # Aggregate the day's events in SQLite
+        cursor.execute(_DAY_TOTALS_SQL, (date,))
+
+        # First/last touch come back as HH:MM, sliced from the ISO timestamps
+        total_touches, total_duration, first_touch, last_touch, *hourly = cursor.fetchone()
+        if not total_touches:
+            return
 
-            conn.commit()
+        cursor.execute(_UPSERT_SUMMARY_SQL, (
+            date, total_touches, total_duration, first_touch, last_touch, *hourly
+        ))
+        cursor.execute(_ROLLUP_MONTH_SQL, (date[:7],))
 
     def get_daily_stats(self, date: Optional[str] = None) -> Optional[DailyStats]:
         """Get statistics for a specific date.
@@ -162,12 +385,12 @@ class StatisticsManager:
             DailyStats object or None if no data for the date.
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = datetime.now().isoformat()[:10]
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT total_touches, total_duration, first_touch, last_touch, hourly_distribution
+            cursor.execute(f'''
+                SELECT total_touches, total_duration, first_touch, last_touch, {", ".join(_HOUR_COLUMNS)}
                 FROM daily_summaries
                 WHERE date = ?
             ''', (date,))
@@ -184,10 +407,8 @@ class StatisticsManager:
                     hourly_distribution={}
                 )
 
-            total_touches, total_duration, first_touch, last_touch, hourly_json = row
-            hourly = json.loads(hourly_json) if hourly_json else {}
-            # Convert string keys to int
-            hourly = {int(k): v for k, v in hourly.items()}
+            total_touches, total_duration, first_touch, last_touch, *hour_counts = row
+            hourly = {hour: count for hour, count in enumerate(hour_counts) if count}
 
             return DailyStats(
                 date=date,
@@ -210,61 +431,58 @@ class StatisticsManager:
         """
         if start_date is None:
             start = datetime.now() - timedelta(days=6)
-            start_date = start.strftime("%Y-%m-%d")
         else:
             start = datetime.strptime(start_date, "%Y-%m-%d")
 
-        end = start + timedelta(days=6)
-        end_date = end.strftime("%Y-%m-%d")
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT date, total_touches
-                FROM daily_summaries
-                WHERE date >= ? AND date <= ?
-                ORDER BY date
-            ''', (start_date, end_date))
-
-            rows = cursor.fetchall()
-
-        daily_counts = {}
-        total_touches = 0
-        best_day = None
-        worst_day = None
-        min_touches = float('inf')
-        max_touches = 0
+        with self._read() as conn:
+            return self._query_weekly(conn, start)
+
+    @staticmethod
+    def _query_weekly(conn: sqlite3.Connection, start: datetime) -> WeeklyStats:
+        """Compute get_weekly_stats() for the week starting at the given day."""
+        start_date = start.strftime("%Y-%m-%d")
+        end_date = (start + timedelta(days=6)).strftime("%Y-%m-%d")
+
+        # Best/worst day (fewest/most touches, latest date on ties) tagged in SQL
+        rows = conn.execute('''
+            SELECT date, total_touches,
+                   FIRST_VALUE(date) OVER (ORDER BY total_touches ASC, date DESC),
+                   FIRST_VALUE(date) OVER (ORDER BY total_touches DESC, date DESC),
+                   MAX(total_touches) OVER ()
+            FROM daily_summaries
+            WHERE date >= ? AND date <= ?
+        ''', (start_date, end_date)).fetchall()
 
         # Fill in all days in the range
-        for i in range(7):
-            d = (start + timedelta(days=i)).strftime("%Y-%m-%d")
-            daily_counts[d] = 0
-
-        for date, count in rows:
-            daily_counts[date] = count
-            total_touches += count
-
-            if count <= min_touches:
-                min_touches = count
-                best_day = date
-            if count >= max_touches:
-                max_touches = count
-                worst_day = date
+        daily_counts = dict.fromkeys(
+            [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)], 0
+        )
+        if not rows:
+            # Nothing logged this week
+            return WeeklyStats(
+                start_date=start_date,
+                end_date=end_date,
+                total_touches=0,
+                daily_average=0.0,
+                best_day=None,
+                worst_day=None,
+                daily_counts=daily_counts
+            )
 
-        days_with_data = len([c for c in daily_counts.values() if c > 0])
-        daily_average = total_touches / 7  # Always divide by 7 for weekly average
+        daily_counts.update((row[0], row[1]) for row in rows)
+        total_touches = sum(row[1] for row in rows)
 
         return WeeklyStats(
             start_date=start_date,
             end_date=end_date,
             total_touches=total_touches,
-            daily_average=daily_average,
-            best_day=best_day if min_touches < float('inf') else None,
-            worst_day=worst_day if max_touches > 0 else None,
+            daily_average=total_touches / 7,  # Always divide by 7 for weekly average
+            best_day=rows[0][2],
+            worst_day=rows[0][3] if rows[0][4] > 0 else None,
             daily_counts=daily_counts
         )
 
-    def get_monthly_calendar(self, year: int, month: int) -> Dict[int, int]:
+    def get_monthly_calendar(self, year: int, month: int) -> MonthlyCalendar:
         """Get touch counts for each day of a month (for calendar display).
 
         Args:
@@ -272,7 +490,8 @@ class StatisticsManager:
             month: Month (1-12)
 
         Returns:
-            Dictionary mapping day number (1-31) to touch count.
+            MonthlyCalendar mapping day number (1-31) to touch count,
+            with the month's highest count.
         """
         start_date = f"{year:04d}-{month:02d}-01"
 
@@ -282,7 +501,7 @@ class StatisticsManager:
         else:
             end_date = f"{year:04d}-{month + 1:02d}-01"
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT date, total_touches
@@ -290,14 +509,12 @@ class StatisticsManager:
                 WHERE date >= ? AND date < ?
             ''', (start_date, end_date))
 
-            rows = cursor.fetchall()
+            # Read rows straight off the cursor instead of fetching a list first
+            calendar_data = {int(date_str[8:10]): count for date_str, count in cursor}
 
-        calendar_data = {}
-        for date_str, count in rows:
-            day = int(date_str.split("-")[2])
-            calendar_data[day] = count
+        max_value = max(1, max(calendar_data.values(), default=1))
 
-        return calendar_data
+        return MonthlyCalendar(values=calendar_data, max_value=max_value)
 
     def get_streak_info(self) -> Dict[str, Any]:
         """Get information about touch-free streaks.
@@ -310,90 +527,91 @@ class StatisticsManager:
         """
         today = datetime.now().strftime("%Y-%m-%d")
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Get the most recent date with touches
-            cursor.execute('''
-                SELECT date FROM daily_summaries
+        with self._read() as conn:
+            return self._query_streak(conn, today)
+
+    @staticmethod
+    def _query_streak(conn: sqlite3.Connection, today: str) -> Dict[str, Any]:
+        """Compute get_streak_info() for the given date with a single query."""
+        # Gaps between consecutive touch days, measured in SQLite
+        row = conn.execute('''
+            SELECT MAX(date),
+                   CAST(julianday(?) - julianday(MAX(date)) AS INTEGER),
+                   CAST(MAX(gap) AS INTEGER)
+            FROM (
+                SELECT date,
+                       julianday(date) - julianday(LAG(date) OVER (ORDER BY date)) - 1 AS gap
+                FROM daily_summaries
                 WHERE total_touches > 0
-                ORDER BY date DESC
-                LIMIT 1
-            ''')
-
-            row = cursor.fetchone()
-            if not row:
-                return {
-                    "current_streak": 0,
-                    "best_streak": 0,
-                    "last_touch_date": None
-                }
-
-            last_touch_date = row[0]
-
-            # Calculate current streak (days since last touch)
-            last_touch = datetime.strptime(last_touch_date, "%Y-%m-%d")
-            today_dt = datetime.strptime(today, "%Y-%m-%d")
-            current_streak = (today_dt - last_touch).days
-            if last_touch_date == today:
-                current_streak = 0
-
-            # Get all dates with data to calculate best streak
-            cursor.execute('''
-                SELECT date, total_touches FROM daily_summaries
-                ORDER BY date
-            ''')
-
-            all_data = cursor.fetchall()
-
-        # Calculate best streak (longest gap between touch days)
-        best_streak = 0
-        prev_touch_date = None
+            )
+        ''', (today,)).fetchone()
 
-        for date_str, count in all_data:
-            if count > 0:
-                if prev_touch_date:
-                    d1 = datetime.strptime(prev_touch_date, "%Y-%m-%d")
-                    d2 = datetime.strptime(date_str, "%Y-%m-%d")
-                    gap = (d2 - d1).days - 1  # Days between touches
-                    best_streak = max(best_streak, gap)
-                prev_touch_date = date_str
+        last_touch_date, current_streak, best_streak = row
+        if last_touch_date is None:
+            return {
+                "current_streak": 0,
+                "best_streak": 0,
+                "last_touch_date": None
+            }
 
         return {
             "current_streak": current_streak,
-            "best_streak": best_streak,
+            "best_streak": best_streak or 0,
             "last_touch_date": last_touch_date
         }
 
-    def get_hourly_pattern(self, days: int = 7) -> Dict[int, int]:
+    def get_summary_bundle(self) -> SummaryBundle:
+        """Get total, last-7-day and streak statistics together.
+
+        Equivalent to calling get_total_stats(), get_weekly_stats() and
+        get_streak_info(), but takes the database lock only once.
+
+        Returns:
+            SummaryBundle with the three results.
+        """
+        now = datetime.now()
+
+        with self._read() as conn:
+            return SummaryBundle(
+                total=self._query_totals(conn),
+                weekly=self._query_weekly(conn, now - timedelta(days=6)),
+                streak=self._query_streak(conn, now.strftime("%Y-%m-%d"))
+            )
+
+    def get_hourly_pattern(self, days: int = 7) -> HourlyPattern:
         """Get aggregated hourly touch pattern over recent days.
 
         Args:
             days: Number of days to include in the analysis.
 
         Returns:
-            Dictionary mapping hour (0-23) to total touch count.
+            HourlyPattern mapping hour (0-23) to total touch count,
+            with the highest hourly count.
         """
         start_date = (datetime.now() - timedelta(days=days-1)).strftime("%Y-%m-%d")
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
+            # All 24 hours, zero-filled by joining the counts onto an hours table
             cursor.execute('''
-                SELECT hour, COUNT(*) as count
-                FROM touch_events
-                WHERE date >= ?
-                GROUP BY hour
-                ORDER BY hour
+                WITH RECURSIVE hours(hour) AS (
+                    SELECT 0 UNION ALL SELECT hour + 1 FROM hours WHERE hour < 23
+                ),
+                counts(hour, count) AS (
+                    SELECT hour, COUNT(*) FROM touch_events
+                    WHERE date >= ?
+                    GROUP BY hour
+                )
+                SELECT hours.hour, COALESCE(counts.count, 0)
+                FROM hours LEFT JOIN counts USING (hour)
+                ORDER BY hours.hour
             ''', (start_date,))
 
-            rows = cursor.fetchall()
+            hourly = dict(cursor.fetchall())
 
-        # Initialize all hours to 0
-        hourly = {h: 0 for h in range(24)}
-        for hour, count in rows:
-            hourly[hour] = count
+        max_value = max(1, *hourly.values())
 
-        return hourly
+        return HourlyPattern(values=hourly, max_value=max_value)
 
     def get_recent_events(self, limit: int = 10) -> List[TouchEvent]:
         """Get the most recent touch events.
@@ -404,21 +622,17 @@ class StatisticsManager:
         Returns:
             List of TouchEvent objects, most recent first.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT timestamp, duration, closest_distance
                 FROM touch_events
-                ORDER BY timestamp DESC
+                ORDER BY date DESC, timestamp DESC
                 LIMIT ?
             ''', (limit,))
 
-            rows = cursor.fetchall()
-
-        return [
-            TouchEvent(timestamp=r[0], duration=r[1], closest_distance=r[2])
-            for r in rows
-        ]
+            # Columns are selected in TouchEvent field order
+            return [TouchEvent(*row) for row in cursor]
 
     def get_total_stats(self) -> Dict[str, Any]:
         """Get overall statistics since tracking began.
@@ -426,29 +640,24 @@ class StatisticsManager:
         Returns:
             Dictionary with total statistics.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Total touches and duration
-            cursor.execute('''
-                SELECT COUNT(*), COALESCE(SUM(duration), 0)
-                FROM touch_events
-            ''')
-            total_touches, total_duration = cursor.fetchone()
-
-            # First and last event dates
-            cursor.execute('''
-                SELECT MIN(date), MAX(date)
-                FROM touch_events
-            ''')
-            first_date, last_date = cursor.fetchone()
-
-            # Days tracked
-            cursor.execute('''
-                SELECT COUNT(DISTINCT date)
-                FROM touch_events
-            ''')
-            days_with_touches = cursor.fetchone()[0]
+        with self._read() as conn:
+            return self._query_totals(conn)
+
+    @staticmethod
+    def _query_totals(conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Compute get_total_stats() from the monthly rollup."""
+        # Total touches, duration and days with touches
+        total_touches, total_duration, days_with_touches = conn.execute('''
+            SELECT COALESCE(SUM(total_touches), 0), COALESCE(SUM(total_duration), 0),
+                   COALESCE(SUM(days_with_touches), 0)
+            FROM monthly_summaries
+        ''').fetchone()
+
+        # First and last event dates (daily summaries exist only for days with touches)
+        first_date, last_date = conn.execute('''
+            SELECT MIN(date), MAX(date)
+            FROM daily_summaries
+        ''').fetchone()
 
         return {
             "total_touches": total_touches,
@@ -471,25 +680,26 @@ class StatisticsManager:
         """
         cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).strftime("%Y-%m-%d")
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Buffered events count as stored data too
+        self._flush()
 
-            # Count events to be deleted
-            cursor.execute('''
-                SELECT COUNT(*) FROM touch_events WHERE date < ?
-            ''', (cutoff_date,))
-            count = cursor.fetchone()[0]
+        with self._write() as conn:
+            cursor = conn.cursor()
 
-            # Delete old events
-            cursor.execute('''
+            # Delete old events (rowcount gives the number deleted)
+            count = cursor.execute('''
                 DELETE FROM touch_events WHERE date < ?
-            ''', (cutoff_date,))
+            ''', (cutoff_date,)).rowcount
 
             # Delete old summaries
             cursor.execute('''
                 DELETE FROM daily_summaries WHERE date < ?
             ''', (cutoff_date,))
 
-            conn.commit()
+            # Drop older months and recompute the partially cleared one
+            cursor.execute('''
+                DELETE FROM monthly_summaries WHERE year_month <= ?
+            ''', (cutoff_date[:7],))
+            cursor.execute(_ROLLUP_MONTH_SQL, (cutoff_date[:7],))
 
         return count
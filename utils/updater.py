@@ -1,8 +1,13 @@
 """Update checker module for Don't Touch application."""
+import re
 import threading
 import webbrowser
-from typing import Optional, Callable, Tuple
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Callable, Tuple, Dict, Any
 from dataclasses import dataclass
+import urllib.error
 import urllib.request
 import json
 import ssl
@@ -12,6 +17,16 @@ APP_VERSION = "1.0.0"
 GITHUB_API_URL = "https://api.github.com/repos/writingdeveloper/dont-touch/releases/latest"
 GITHUB_RELEASES_URL = "https://github.com/writingdeveloper/dont-touch/releases"
 
+# Result of the running update check; concurrent requests share it
+_inflight: Optional[Future] = None
+_inflight_lock = threading.Lock()
+
+# Last release response and its ETag, for conditional requests
+UPDATE_CACHE_PATH = Path.home() / ".dont-touch" / "update_cache.json"
+
+# Leading numeric part of a version like "v1.2.3-beta"
+_VERSION_RE = re.compile(r"\s*v?(\d+(?:\.\d+)*)")
+
 
 @dataclass
 class UpdateInfo:
@@ -23,6 +38,7 @@ class UpdateInfo:
     is_update_available: bool
 
 
+@lru_cache(maxsize=32)
 def parse_version(version: str) -> Tuple[int, ...]:
     """Parse version string to tuple for comparison.
 
@@ -32,19 +48,11 @@ def parse_version(version: str) -> Tuple[int, ...]:
     Returns:
         Tuple of integers for comparison
     """
-    # Remove 'v' prefix if present
-    version = version.lstrip('v').strip()
-
-    # Split by dots and convert to integers
-    try:
-        parts = []
-        for part in version.split('.'):
-            # Handle versions like "1.0.0-beta"
-            num_part = part.split('-')[0]
-            parts.append(int(num_part))
-        return tuple(parts)
-    except (ValueError, AttributeError):
+    # Skip a 'v' prefix and ignore suffixes like "-beta"
+    match = _VERSION_RE.match(version)
+    if not match:
         return (0, 0, 0)
+    return tuple(int(part) for part in match.group(1).split('.'))
 
 
 def compare_versions(current: str, latest: str) -> int:
@@ -70,6 +78,26 @@ def compare_versions(current: str, latest: str) -> int:
         return 0
 
 
+def _load_update_cache() -> Optional[Dict[str, Any]]:
+    """Load the cached release response ({"etag": ..., "data": ...}), if any."""
+    try:
+        cache = json.loads(UPDATE_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(cache, dict) and cache.get('etag') and isinstance(cache.get('data'), dict):
+        return cache
+    return None
+
+
+def _save_update_cache(etag: str, data: Dict[str, Any]) -> None:
+    """Cache a release response with its ETag."""
+    try:
+        UPDATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        UPDATE_CACHE_PATH.write_text(json.dumps({'etag': etag, 'data': data}), encoding='utf-8')
+    except OSError as e:
+        print(f"Failed to save update cache: {e}")
+
+
 def check_for_updates() -> Optional[UpdateInfo]:
     """Check GitHub for the latest release.
 
@@ -81,17 +109,29 @@ def check_for_updates() -> Optional[UpdateInfo]:
         context = ssl.create_default_context()
 
         # Create request with User-Agent (required by GitHub API)
-        request = urllib.request.Request(
-            GITHUB_API_URL,
-            headers={
-                'User-Agent': 'DontTouch-UpdateChecker',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-        )
+        headers = {
+            'User-Agent': 'DontTouch-UpdateChecker',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+
+        # Ask only for changes since the cached response (304 if unchanged)
+        cache = _load_update_cache()
+        if cache:
+            headers['If-None-Match'] = cache['etag']
+
+        request = urllib.request.Request(GITHUB_API_URL, headers=headers)
 
         # Make request with timeout
-        with urllib.request.urlopen(request, timeout=10, context=context) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        try:
+            with urllib.request.urlopen(request, timeout=10, context=context) as response:
+                data = json.loads(response.read().decode('utf-8'))
+                etag = response.headers.get('ETag')
+            if etag:
+                _save_update_cache(etag, data)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not cache:
+                raise
+            data = cache['data']
 
         # Extract version from tag_name (usually "v1.0.0" or "1.0.0")
         latest_version = data.get('tag_name', '0.0.0')
@@ -118,15 +158,24 @@ def check_for_updates() -> Optional[UpdateInfo]:
 def check_for_updates_async(callback: Callable[[Optional[UpdateInfo]], None]) -> None:
     """Check for updates in a background thread.
 
+    Calls made while a check is running get that check's result.
+
     Args:
         callback: Function to call with UpdateInfo when check completes
     """
-    def _check():
-        result = check_for_updates()
-        callback(result)
-
-    thread = threading.Thread(target=_check, daemon=True)
-    thread.start()
+    global _inflight
+    with _inflight_lock:
+        future = _inflight
+        if future is None or future.done():
+            future = _inflight = Future()
+            # Daemon thread, so quitting never waits for a slow GitHub response
+            thread = threading.Thread(
+                target=lambda: future.set_result(check_for_updates()),
+                name="updater", daemon=True
+            )
+            thread.start()
+
+    future.add_done_callback(lambda f: callback(f.result()))
 
 
 def open_download_page() -> None: